@@ -13,6 +13,7 @@ Time tiers:
   2 hr   -> FOIA request, testimony prep, investigative research, content creation
 """
 
+from bisect import bisect_left
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
@@ -87,6 +88,9 @@ class ActionGenerator:
             ],
         ),
     }
+    # Tier names in order, and the max minutes of every tier but the last
+    _TIER_NAMES = tuple(TIME_TIERS)
+    _TIER_LIMITS = tuple(max_minutes for max_minutes, _ in TIME_TIERS.values())[:-1]
 
     # Action generation templates by type
     ACTION_BLUEPRINTS: Dict[ActionType, Dict[str, Any]] = {
@@ -316,14 +320,7 @@ class ActionGenerator:
     @classmethod
     def get_time_tier(cls, minutes_available: int) -> str:
         """Determine which time tier fits the available minutes."""
-        if minutes_available <= 5:
-            return "quick"
-        elif minutes_available <= 15:
-            return "short"
-        elif minutes_available <= 30:
-            return "medium"
-        else:
-            return "long"
+        return cls._TIER_NAMES[bisect_left(cls._TIER_LIMITS, minutes_available)]
 
     @classmethod
     def generate_for_time(
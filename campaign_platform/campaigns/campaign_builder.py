@@ -10,6 +10,7 @@ Templates encode real campaign structures used by effective advocacy orgs.
 """
 
 from datetime import date, timedelta
+from functools import cache, lru_cache
 from typing import Dict, List, Optional, Any
 
 from .models import (
@@ -345,30 +346,27 @@ class CampaignBuilder:
         start = start_date or date.today()
 
         # Calculate deadline from escalation phases
-        total_weeks = sum(
-            phase["duration_weeks"]
-            for phase in (custom_escalation or template["escalation_ladder"])
-        )
+        if custom_escalation:
+            total_weeks = sum(phase["duration_weeks"] for phase in custom_escalation)
+        else:
+            total_weeks = _template_weeks(campaign_type)
         deadline = start + timedelta(weeks=total_weeks)
 
-        # Build slug from name
-        slug = name.lower().replace(" ", "-").replace("'", "")
-        slug = "".join(c for c in slug if c.isalnum() or c == "-")
+        channels, tactics, win_conditions = _template_columns(campaign_type)
+        if custom_escalation:
+            win_conditions = tuple(phase["win_trigger"] for phase in custom_escalation)
 
         campaign = Campaign(
             name=name,
-            slug=slug,
+            slug=_slugify(name),
             campaign_type=campaign_type,
             target_summary=target_summary,
             goal=goal,
             status=CampaignStatus.DRAFT,
-            channels=[ch.value for ch in template["channels"]],
-            tactics=[at.value for at in template["action_types"]],
+            channels=list(channels),
+            tactics=list(tactics),
             escalation_ladder=custom_escalation or template["escalation_ladder"],
-            win_conditions=[
-                phase["win_trigger"]
-                for phase in (custom_escalation or template["escalation_ladder"])
-            ],
+            win_conditions=list(win_conditions),
             start_date=start,
             deadline=deadline,
         )
@@ -511,9 +509,36 @@ class CampaignBuilder:
                 "type": ctype.value,
                 "channels": [ch.value for ch in template["channels"]],
                 "phases": len(template["escalation_ladder"]),
-                "total_weeks": sum(
-                    p["duration_weeks"] for p in template["escalation_ladder"]
-                ),
+                "total_weeks": _template_weeks(ctype),
                 "action_types": [at.value for at in template["action_types"]],
             })
         return summaries
+
+
+@cache
+def _template_weeks(campaign_type: CampaignType) -> int:
+    """Total duration of a template's escalation ladder, summed once per type."""
+    return sum(
+        phase["duration_weeks"]
+        for phase in CampaignBuilder.TEMPLATES[campaign_type]["escalation_ladder"]
+    )
+
+
+@cache
+def _template_columns(
+    campaign_type: CampaignType,
+) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+    """A template's channel values, tactic values and win triggers."""
+    template = CampaignBuilder.TEMPLATES[campaign_type]
+    return (
+        tuple(ch.value for ch in template["channels"]),
+        tuple(at.value for at in template["action_types"]),
+        tuple(phase["win_trigger"] for phase in template["escalation_ladder"]),
+    )
+
+
+@lru_cache(maxsize=1024)
+def _slugify(name: str) -> str:
+    """Build a slug from a campaign name."""
+    slug = name.lower().replace(" ", "-").replace("'", "")
+    return "".join(c for c in slug if c.isalnum() or c == "-")
@@ -4,6 +4,7 @@ SQLAlchemy models for campaigns, actions, targets, and participants.
 
 from datetime import datetime, date
 from enum import Enum as PyEnum
+from functools import cached_property
 from typing import Optional, List
 
 from sqlalchemy import (
@@ -17,18 +18,35 @@ from sqlalchemy import (
     Date,
     ForeignKey,
     Enum,
+    Index,
     JSON,
     Table,
+    case,
     create_engine,
+    delete,
+    event,
+    func,
+    insert,
+    inspect,
+    select,
+    text,
+    update,
 )
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
     mapped_column,
+    object_session,
     relationship,
     Session,
     sessionmaker,
 )
+from sqlalchemy.schema import CreateColumn
+from sqlalchemy.sql.functions import FunctionElement
 
 
 class Base(DeclarativeBase):
@@ -110,14 +128,18 @@ class TacticChannel(str, PyEnum):
 campaign_channels = Table(
     "campaign_channels",
     Base.metadata,
-    Column("campaign_id", Integer, ForeignKey("campaigns.id"), primary_key=True),
+    Column(
+        "campaign_id", Integer, ForeignKey("campaigns.id", ondelete="CASCADE"), primary_key=True
+    ),
     Column("channel", String(50), primary_key=True),
 )
 
 campaign_tactics = Table(
     "campaign_tactics",
     Base.metadata,
-    Column("campaign_id", Integer, ForeignKey("campaigns.id"), primary_key=True),
+    Column(
+        "campaign_id", Integer, ForeignKey("campaigns.id", ondelete="CASCADE"), primary_key=True
+    ),
     Column("tactic", String(100), primary_key=True),
 )
 
@@ -164,6 +186,11 @@ class Campaign(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
     )
+    # Denormalized action counts for the progress endpoint. Kept current by
+    # the Action ORM events below and by the API's bulk status updates.
+    total_actions: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    completed_actions: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    verified_actions: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
 
     # Relationships
     actions: Mapped[List["Action"]] = relationship(
@@ -176,8 +203,10 @@ class Campaign(Base):
     def __repr__(self):
         return f"<Campaign(id={self.id}, name='{self.name}', status='{self.status}')>"
 
-    @property
+    @cached_property
     def completion_pct(self) -> float:
+        # Cached per instance; the listeners below Action drop it whenever the
+        # campaign is expired/refreshed or its actions change.
         if not self.actions:
             return 0.0
         completed = sum(
@@ -188,18 +217,37 @@ class Campaign(Base):
 
 class Action(Base):
     __tablename__ = "actions"
+    __table_args__ = (
+        # Metrics, progress and suggestions filter a campaign's actions by these
+        Index("ix_action_campaign_status", "campaign_id", "status"),
+        Index("ix_action_campaign_type", "campaign_id", "action_type"),
+        Index("ix_action_assigned_status", "assigned_to", "status"),
+        # Overdue scans only look at open actions (Enum columns store member names)
+        Index(
+            "ix_action_open_deadline",
+            "deadline",
+            postgresql_where=text("status NOT IN ('COMPLETED', 'VERIFIED', 'EXPIRED')"),
+            sqlite_where=text("status NOT IN ('COMPLETED', 'VERIFIED', 'EXPIRED')"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    campaign_id: Mapped[int] = mapped_column(ForeignKey("campaigns.id"), nullable=False)
-    action_type: Mapped[str] = mapped_column(Enum(ActionType), nullable=False)
+    # active_history: the counter and totals listeners diff old against new
+    # values, so load the old value even when the instance has been expired
+    campaign_id: Mapped[int] = mapped_column(
+        ForeignKey("campaigns.id"), nullable=False, active_history=True
+    )
+    action_type: Mapped[str] = mapped_column(
+        Enum(ActionType), nullable=False, active_history=True
+    )
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
     template_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     template_vars: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)
-    estimated_minutes: Mapped[int] = mapped_column(Integer, default=15)
+    estimated_minutes: Mapped[int] = mapped_column(Integer, default=15, active_history=True)
     priority: Mapped[int] = mapped_column(Integer, default=5)  # 1=highest, 10=lowest
     status: Mapped[str] = mapped_column(
-        Enum(ActionStatus), default=ActionStatus.AVAILABLE
+        Enum(ActionStatus), default=ActionStatus.AVAILABLE, active_history=True
     )
     deadline: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     assigned_to: Mapped[Optional[int]] = mapped_column(
@@ -223,6 +271,273 @@ class Action(Base):
         return False
 
 
+def _forget_completion_pct(campaign) -> None:
+    campaign.__dict__.pop("completion_pct", None)
+
+
+@event.listens_for(Campaign, "expire")
+def _expire_completion_pct(campaign, attrs):
+    _forget_completion_pct(campaign)
+
+
+@event.listens_for(Campaign, "refresh")
+def _refresh_completion_pct(campaign, context, attrs):
+    _forget_completion_pct(campaign)
+
+
+@event.listens_for(Campaign.actions, "append")
+@event.listens_for(Campaign.actions, "remove")
+def _actions_changed(campaign, action, initiator):
+    _forget_completion_pct(campaign)
+
+
+@event.listens_for(Action.status, "set")
+def _action_status_changed(action, value, oldvalue, initiator):
+    # Actions loaded through Campaign.actions don't have .campaign populated;
+    # look the owner up in the identity map instead of loading it
+    campaign = action.__dict__.get("campaign")
+    session = object_session(action)
+    if campaign is None and session is not None:
+        key = session.identity_key(Campaign, action.campaign_id)
+        campaign = session.identity_map.get(key)
+    if campaign is not None:
+        _forget_completion_pct(campaign)
+
+
+def action_counter_values(total: int = 0, completed: int = 0, verified: int = 0) -> dict:
+    """SET clause adjusting a campaign's denormalized action counters."""
+    return {
+        "total_actions": Campaign.total_actions + total,
+        "completed_actions": Campaign.completed_actions + completed,
+        "verified_actions": Campaign.verified_actions + verified,
+        # Counter upkeep is not an edit to the campaign itself
+        "updated_at": Campaign.updated_at,
+    }
+
+
+def _status_counts(status) -> tuple:
+    done = status in (ActionStatus.COMPLETED, ActionStatus.VERIFIED)
+    return int(done), int(status == ActionStatus.VERIFIED)
+
+
+@event.listens_for(Action, "after_insert")
+def _count_inserted_action(mapper, connection, action):
+    completed, verified = _status_counts(action.status)
+    connection.execute(
+        update(Campaign)
+        .where(Campaign.id == action.campaign_id)
+        .values(**action_counter_values(1, completed, verified))
+    )
+
+
+@event.listens_for(Action, "after_update")
+def _count_status_change(mapper, connection, action):
+    state = inspect(action)
+    status_history = state.attrs.status.history
+    campaign_history = state.attrs.campaign_id.history
+    old_status = status_history.deleted[0] if status_history.deleted else action.status
+    old_campaign_id = (
+        campaign_history.deleted[0] if campaign_history.deleted else action.campaign_id
+    )
+    old_completed, old_verified = _status_counts(old_status)
+    completed, verified = _status_counts(action.status)
+    if old_campaign_id != action.campaign_id:
+        # Moved to another campaign: take it off the old one's counters
+        connection.execute(
+            update(Campaign)
+            .where(Campaign.id == old_campaign_id)
+            .values(**action_counter_values(-1, -old_completed, -old_verified))
+        )
+        connection.execute(
+            update(Campaign)
+            .where(Campaign.id == action.campaign_id)
+            .values(**action_counter_values(1, completed, verified))
+        )
+    elif (completed, verified) != (old_completed, old_verified):
+        connection.execute(
+            update(Campaign)
+            .where(Campaign.id == action.campaign_id)
+            .values(
+                **action_counter_values(0, completed - old_completed, verified - old_verified)
+            )
+        )
+
+
+@event.listens_for(Action, "after_delete")
+def _count_deleted_action(mapper, connection, action):
+    completed, verified = _status_counts(action.status)
+    connection.execute(
+        update(Campaign)
+        .where(Campaign.id == action.campaign_id)
+        .values(**action_counter_values(-1, -completed, -verified))
+    )
+
+
+def recount_action_totals(bind) -> None:
+    """Recompute every campaign's action counters from the actions table."""
+
+    def count(*criteria):
+        return (
+            select(func.count())
+            .where(Action.campaign_id == Campaign.id, *criteria)
+            .scalar_subquery()
+        )
+
+    bind.execute(
+        update(Campaign).values(
+            total_actions=count(),
+            completed_actions=count(
+                Action.status.in_((ActionStatus.COMPLETED, ActionStatus.VERIFIED))
+            ),
+            verified_actions=count(Action.status == ActionStatus.VERIFIED),
+            updated_at=Campaign.updated_at,
+        )
+    )
+
+
+class CampaignActionTotals(Base):
+    """
+    Running totals of a campaign's actions, one row per action type.
+
+    Kept current by the Action listeners below (and by the API's bulk status
+    updates), so ROI can be read from a handful of rows instead of a scan.
+    """
+
+    __tablename__ = "campaign_action_totals"
+
+    campaign_id: Mapped[int] = mapped_column(
+        ForeignKey("campaigns.id", ondelete="CASCADE"), primary_key=True
+    )
+    action_type: Mapped[str] = mapped_column(Enum(ActionType), primary_key=True)
+    action_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    total_minutes: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    completed_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    completed_minutes: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+
+
+_TYPE_TOTAL_COLUMNS = ("action_count", "total_minutes", "completed_count", "completed_minutes")
+
+
+def _type_totals(status, minutes) -> dict:
+    """One action's contribution to its campaign/type totals row."""
+    minutes = minutes or 0
+    done = status in (ActionStatus.COMPLETED, ActionStatus.VERIFIED)
+    return {
+        "action_count": 1,
+        "total_minutes": minutes,
+        "completed_count": int(done),
+        "completed_minutes": minutes if done else 0,
+    }
+
+
+def action_totals_upsert(dialect_name: str, campaign_id: int, action_type, **deltas):
+    """INSERT ... ON CONFLICT adding deltas to a campaign's totals for one action type."""
+    dialect_insert = postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+    values = dict.fromkeys(_TYPE_TOTAL_COLUMNS, 0)
+    values.update(deltas)
+    stmt = dialect_insert(CampaignActionTotals).values(
+        campaign_id=campaign_id, action_type=action_type, **values
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[CampaignActionTotals.campaign_id, CampaignActionTotals.action_type],
+        set_={
+            name: getattr(CampaignActionTotals, name) + getattr(stmt.excluded, name)
+            for name in _TYPE_TOTAL_COLUMNS
+        },
+    )
+
+
+@event.listens_for(Action, "after_insert")
+def _total_inserted_action(mapper, connection, action):
+    connection.execute(
+        action_totals_upsert(
+            connection.dialect.name,
+            action.campaign_id,
+            action.action_type,
+            **_type_totals(action.status, action.estimated_minutes),
+        )
+    )
+
+
+@event.listens_for(Action, "after_update")
+def _retotal_changed_action(mapper, connection, action):
+    state = inspect(action)
+    old = {}
+    for key in ("campaign_id", "action_type", "status", "estimated_minutes"):
+        history = state.attrs[key].history
+        old[key] = history.deleted[0] if history.deleted else getattr(action, key)
+    new = {key: getattr(action, key) for key in old}
+    if old == new:
+        return
+    before = _type_totals(old["status"], old["estimated_minutes"])
+    after = _type_totals(new["status"], new["estimated_minutes"])
+    dialect_name = connection.dialect.name
+    if (old["campaign_id"], old["action_type"]) == (new["campaign_id"], new["action_type"]):
+        deltas = {name: after[name] - before[name] for name in after}
+        if any(deltas.values()):
+            connection.execute(
+                action_totals_upsert(
+                    dialect_name, new["campaign_id"], new["action_type"], **deltas
+                )
+            )
+        return
+    # Moved to another campaign or type: take it out of one row, into another
+    connection.execute(
+        action_totals_upsert(
+            dialect_name,
+            old["campaign_id"],
+            old["action_type"],
+            **{name: -value for name, value in before.items()},
+        )
+    )
+    connection.execute(
+        action_totals_upsert(dialect_name, new["campaign_id"], new["action_type"], **after)
+    )
+
+
+@event.listens_for(Action, "after_delete")
+def _total_deleted_action(mapper, connection, action):
+    before = _type_totals(action.status, action.estimated_minutes)
+    connection.execute(
+        action_totals_upsert(
+            connection.dialect.name,
+            action.campaign_id,
+            action.action_type,
+            **{name: -value for name, value in before.items()},
+        )
+    )
+
+
+@event.listens_for(Campaign, "after_delete")
+def _delete_campaign_totals(mapper, connection, campaign):
+    # The FK cascades where it is enforced; SQLite only enforces it with
+    # PRAGMA foreign_keys, and the campaign's actions were deleted first, so
+    # their listeners may just have re-created the totals rows
+    connection.execute(
+        delete(CampaignActionTotals).where(CampaignActionTotals.campaign_id == campaign.id)
+    )
+
+
+def recount_action_type_totals(bind) -> None:
+    """Rebuild campaign_action_totals from the actions table."""
+    done = Action.status.in_((ActionStatus.COMPLETED, ActionStatus.VERIFIED))
+    minutes = func.coalesce(Action.estimated_minutes, 0)
+    bind.execute(delete(CampaignActionTotals))
+    bind.execute(
+        insert(CampaignActionTotals).from_select(
+            ["campaign_id", "action_type", *_TYPE_TOTAL_COLUMNS],
+            select(
+                Action.campaign_id,
+                Action.action_type,
+                func.count(),
+                func.sum(minutes),
+                func.sum(case((done, 1), else_=0)),
+                func.sum(case((done, minutes), else_=0)),
+            ).group_by(Action.campaign_id, Action.action_type),
+        )
+    )
+
+
 class Target(Base):
     __tablename__ = "targets"
 
@@ -283,6 +598,67 @@ class Participant(Base):
         return min(1.0, self.actions_verified / max(1, self.actions_completed))
 
 
+class CampaignMetricsSnapshot(Base):
+    """Last computed impact metrics for a campaign, refreshed after writes."""
+
+    __tablename__ = "campaign_metrics"
+
+    campaign_id: Mapped[int] = mapped_column(
+        ForeignKey("campaigns.id", ondelete="CASCADE"), primary_key=True
+    )
+    metrics: Mapped[dict] = mapped_column(JSON, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
+class CampaignROISnapshot(Base):
+    """Last computed ROI analysis for a campaign, refreshed after writes."""
+
+    __tablename__ = "campaign_roi"
+
+    campaign_id: Mapped[int] = mapped_column(
+        ForeignKey("campaigns.id", ondelete="CASCADE"), primary_key=True
+    )
+    roi: Mapped[dict] = mapped_column(JSON, nullable=False)
+    # Headline figures copied out of the JSON so reports can sort on them
+    total_volunteer_hours: Mapped[float] = mapped_column(Float, nullable=False)
+    roi_pct: Mapped[float] = mapped_column(Float, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
+@event.listens_for(Campaign, "after_delete")
+def _delete_campaign_rows(mapper, connection, campaign):
+    # Same as _delete_campaign_totals: the FKs cascade where they are enforced
+    for table in (
+        campaign_channels,
+        campaign_tactics,
+        CampaignMetricsSnapshot.__table__,
+        CampaignROISnapshot.__table__,
+    ):
+        connection.execute(delete(table).where(table.c.campaign_id == campaign.id))
+
+
+# --- SQL Expressions ---
+
+
+class UtcNow(FunctionElement):
+    """The database clock in UTC, matching the naive UTC DateTime columns."""
+
+    name = "utcnow"
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(UtcNow)
+def _utcnow_default(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(UtcNow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
 # --- Database Setup ---
 
 
@@ -290,6 +666,58 @@ def get_engine(database_url: str = "sqlite:///campaign_platform.db"):
     return create_engine(database_url, echo=False)
 
 
+# Async driver per database backend, substituted for sync drivers when building
+# the API engine (asyncpg comes with the `postgres` extra)
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+}
+# Drivers create_async_engine accepts as they are
+ASYNC_CAPABLE_DRIVERS = {"aiosqlite", "asyncpg", "psycopg"}
+
+
+def async_database_url(database_url: str) -> URL:
+    """The URL with its driver swapped for an async one if it names a sync driver."""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    driver = url.drivername.partition("+")[2]
+    if backend in ASYNC_DRIVERS and driver not in ASYNC_CAPABLE_DRIVERS:
+        url = url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+    return url
+
+
+def get_async_engine(
+    database_url: str = "sqlite:///campaign_platform.db", **kwargs
+) -> AsyncEngine:
+    return create_async_engine(async_database_url(database_url), echo=False, **kwargs)
+
+
+def migrate_schema(bind) -> None:
+    """
+    Bring an existing database up to the current models: create missing
+    tables, add columns and indexes introduced after a table already existed,
+    and recount the denormalized action totals. New columns must be nullable
+    or have a server default. Run explicitly (`campaign migrate`), since the
+    ALTER TABLEs take locks.
+    """
+    if isinstance(bind, Engine):
+        with bind.begin() as connection:
+            return migrate_schema(connection)
+
+    Base.metadata.create_all(bind)
+    inspector = inspect(bind)
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing:
+                ddl = CreateColumn(column).compile(dialect=bind.dialect)
+                bind.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {ddl}"))
+        for index in table.indexes:
+            index.create(bind, checkfirst=True)
+    recount_action_totals(bind)
+    recount_action_type_totals(bind)
+
+
 def create_tables(engine=None):
     if engine is None:
         engine = get_engine()
@@ -7,39 +7,57 @@ Usage:
     campaign track --campaign-id 1
     campaign template --type email --variant corporate_ceo
     campaign export --campaign-id 1 --format json
+    campaign migrate
 """
 
+import csv
+import io
 import json
 import sys
-from datetime import date, datetime
-from typing import Optional
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
 import click
-from sqlalchemy.orm import Session
-
-from campaign_platform.campaigns.models import (
-    Campaign,
-    Action,
-    Target,
-    Participant,
-    CampaignType,
-    CampaignStatus,
-    ActionType,
-    ActionStatus,
-    create_tables,
-    get_session,
+
+from campaign_platform.cli_template import template
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+# Models, builders and metrics pull in SQLAlchemy, so they are
+# imported inside the commands that need them rather than at CLI load.
+
+CAMPAIGN_TYPE_CHOICES = click.Choice(
+    ("corporate", "legislative", "regulatory", "investigation", "cultural")
+)
+TARGET_TYPE_CHOICES = click.Choice(
+    ("corporation", "executive", "legislator", "regulator", "facility", "brand", "investor")
 )
-from campaign_platform.campaigns.campaign_builder import CampaignBuilder
-from campaign_platform.campaigns.action_generator import ActionGenerator
-from campaign_platform.metrics.impact_tracker import ImpactTracker
-from campaign_platform.metrics.roi_calculator import ROICalculator
+EXPORT_FORMAT_CHOICES = click.Choice(("json", "csv"))
 
 
-def get_db() -> Session:
+def get_db() -> "Session":
+    from campaign_platform.campaigns.models import create_tables, get_session
+
     engine = create_tables()
     return get_session(engine)
 
 
+@lru_cache(maxsize=1)
+def _impact_tracker():
+    from campaign_platform.metrics.impact_tracker import ImpactTracker
+
+    return ImpactTracker()
+
+
+@lru_cache(maxsize=1)
+def _roi_calculator():
+    from campaign_platform.metrics.roi_calculator import ROICalculator
+
+    return ROICalculator()
+
+
 @click.group()
 @click.version_option(version="0.1.0")
 def cli():
@@ -56,7 +74,7 @@ def cli():
     "--type",
     "campaign_type",
     required=True,
-    type=click.Choice(["corporate", "legislative", "regulatory", "investigation", "cultural"]),
+    type=CAMPAIGN_TYPE_CHOICES,
     help="Campaign type (determines template and escalation structure)",
 )
 @click.option("--target", required=True, help="Who or what is being targeted")
@@ -64,6 +82,9 @@ def cli():
 @click.option("--start-date", default=None, help="Start date (YYYY-MM-DD), defaults to today")
 def create(name: str, campaign_type: str, target: str, goal: str, start_date: Optional[str]):
     """Create a new campaign from a template."""
+    from campaign_platform.campaigns.campaign_builder import CampaignBuilder
+    from campaign_platform.campaigns.models import CampaignType
+
     db = get_db()
     try:
         start = date.fromisoformat(start_date) if start_date else None
@@ -105,6 +126,8 @@ def create(name: str, campaign_type: str, target: str, goal: str, start_date: Op
 @click.option("--type", "campaign_type", default=None, help="Filter by type")
 def list_campaigns(status: Optional[str], campaign_type: Optional[str]):
     """List all campaigns."""
+    from campaign_platform.campaigns.models import Campaign, CampaignStatus, CampaignType
+
     db = get_db()
     try:
         query = db.query(Campaign)
@@ -142,20 +165,23 @@ def list_campaigns(status: Optional[str], campaign_type: Optional[str]):
 @click.option("--create/--no-create", "create_actions", default=False, help="Create actions in DB")
 def actions(campaign_id: int, minutes: int, participant_id: Optional[int], create_actions: bool):
     """Generate actions based on time available."""
+    from campaign_platform.campaigns.action_generator import ActionGenerator
+    from campaign_platform.campaigns.models import Campaign, Participant, Target
+
     db = get_db()
     try:
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+        campaign = db.get(Campaign, campaign_id)
         if not campaign:
             click.echo(f"Campaign {campaign_id} not found.", err=True)
             sys.exit(1)
 
         participant = None
         if participant_id:
-            participant = db.query(Participant).filter(
-                Participant.id == participant_id
-            ).first()
+            participant = db.get(Participant, participant_id)
 
-        targets = db.query(Target).filter(Target.campaign_id == campaign_id).all()
+        targets = (
+            db.query(Target).filter(Target.campaign_id == campaign_id).order_by(Target.id).all()
+        )
 
         specs = ActionGenerator.generate_for_time(
             campaign=campaign,
@@ -197,25 +223,28 @@ def actions(campaign_id: int, minutes: int, participant_id: Optional[int], creat
 @click.option("--verification-url", default=None, help="URL proving action was taken")
 def complete(action_id: int, verification_url: Optional[str]):
     """Mark an action as completed."""
+    from campaign_platform.campaigns.models import Action, ActionStatus, Participant
+
     db = get_db()
     try:
-        action = db.query(Action).filter(Action.id == action_id).first()
+        # One timestamp, stored as naive UTC like every other writer, so the
+        # action and participant records agree.
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        action = db.get(Action, action_id)
         if not action:
             click.echo(f"Action {action_id} not found.", err=True)
             sys.exit(1)
 
         action.status = ActionStatus.COMPLETED
-        action.completed_at = datetime.utcnow()
+        action.completed_at = now
         if verification_url:
             action.verification_url = verification_url
 
         if action.assigned_to:
-            participant = db.query(Participant).filter(
-                Participant.id == action.assigned_to
-            ).first()
+            participant = db.get(Participant, action.assigned_to)
             if participant:
                 participant.actions_completed += 1
-                participant.last_active = datetime.utcnow()
+                participant.last_active = now
 
         db.commit()
         click.echo(f"Action {action_id} marked as completed.")
@@ -232,15 +261,19 @@ def complete(action_id: int, verification_url: Optional[str]):
 @click.option("--detailed/--summary", default=False, help="Show detailed breakdown")
 def track(campaign_id: int, detailed: bool):
     """Track campaign progress and impact metrics."""
+    from campaign_platform.campaigns.models import Action, Campaign
+
     db = get_db()
     try:
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+        campaign = db.get(Campaign, campaign_id)
         if not campaign:
             click.echo(f"Campaign {campaign_id} not found.", err=True)
             sys.exit(1)
 
-        actions_list = db.query(Action).filter(Action.campaign_id == campaign_id).all()
-        tracker = ImpactTracker()
+        actions_list = (
+            db.query(Action).filter(Action.campaign_id == campaign_id).order_by(Action.id).all()
+        )
+        tracker = _impact_tracker()
         metrics = tracker.compute_campaign_metrics(campaign, actions_list)
 
         click.echo(f"\n{'='*60}")
@@ -282,7 +315,7 @@ def track(campaign_id: int, detailed: bool):
                 )
 
         # ROI
-        calculator = ROICalculator()
+        calculator = _roi_calculator()
         roi = calculator.calculate_campaign_roi(campaign, actions_list)
 
         click.echo(f"\n  ROI Analysis:")
@@ -305,50 +338,7 @@ def track(campaign_id: int, detailed: bool):
 # --- Template Commands ---
 
 
-@cli.command()
-@click.option(
-    "--type",
-    "template_type",
-    required=True,
-    type=click.Choice(["email", "phone", "social", "review"]),
-    help="Template category",
-)
-@click.option("--variant", default=None, help="Specific template variant")
-@click.option("--list/--no-list", "list_templates", default=False, help="List available templates")
-def template(template_type: str, variant: Optional[str], list_templates: bool):
-    """View or list action templates."""
-    import os
-
-    template_dirs = {
-        "email": "email_templates",
-        "phone": "phone_scripts",
-        "social": "social_templates",
-        "review": "review_templates",
-    }
-
-    template_dir = os.path.join(
-        os.path.dirname(__file__), "templates", template_dirs[template_type]
-    )
-
-    if list_templates or not variant:
-        if os.path.isdir(template_dir):
-            templates = [f for f in os.listdir(template_dir) if f.endswith(".txt")]
-            click.echo(f"\nAvailable {template_type} templates:")
-            for t in sorted(templates):
-                click.echo(f"  - {t.replace('.txt', '')}")
-            click.echo()
-        else:
-            click.echo(f"No templates found for {template_type}")
-        return
-
-    template_path = os.path.join(template_dir, f"{variant}.txt")
-    if not os.path.isfile(template_path):
-        click.echo(f"Template not found: {variant}", err=True)
-        click.echo(f"Use --list to see available templates.", err=True)
-        sys.exit(1)
-
-    with open(template_path) as f:
-        click.echo(f.read())
+cli.add_command(template)
 
 
 # --- Export Commands ---
@@ -360,20 +350,24 @@ def template(template_type: str, variant: Optional[str], list_templates: bool):
     "--format",
     "output_format",
     default="json",
-    type=click.Choice(["json", "csv"]),
+    type=EXPORT_FORMAT_CHOICES,
     help="Export format",
 )
 @click.option("--output", "-o", default=None, help="Output file path")
 def export(campaign_id: int, output_format: str, output: Optional[str]):
     """Export campaign data."""
+    from campaign_platform.campaigns.models import Action, Campaign, Target
+
     db = get_db()
     try:
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+        campaign = db.get(Campaign, campaign_id)
         if not campaign:
             click.echo(f"Campaign {campaign_id} not found.", err=True)
             sys.exit(1)
 
-        actions_list = db.query(Action).filter(Action.campaign_id == campaign_id).all()
+        actions_list = (
+            db.query(Action).filter(Action.campaign_id == campaign_id).order_by(Action.id).all()
+        )
         targets = db.query(Target).filter(Target.campaign_id == campaign_id).all()
 
         if output_format == "json":
@@ -416,14 +410,21 @@ def export(campaign_id: int, output_format: str, output: Optional[str]):
             }
             result = json.dumps(data, indent=2)
         else:
-            # CSV export of actions
-            lines = ["id,type,title,status,priority,minutes,completed_at"]
+            # CSV export of actions; csv.writer handles quoting of titles
+            sink = io.StringIO()
+            writer = csv.writer(sink, lineterminator="\n")
+            writer.writerow(("id", "type", "title", "status", "priority", "minutes", "completed_at"))
             for a in actions_list:
-                lines.append(
-                    f"{a.id},{a.action_type},{a.title},{a.status},"
-                    f"{a.priority},{a.estimated_minutes},{a.completed_at or ''}"
-                )
-            result = "\n".join(lines)
+                writer.writerow((
+                    a.id,
+                    getattr(a.action_type, "value", a.action_type),
+                    a.title,
+                    getattr(a.status, "value", a.status),
+                    a.priority,
+                    a.estimated_minutes,
+                    a.completed_at.isoformat() if a.completed_at else "",
+                ))
+            result = sink.getvalue().rstrip("\n")
 
         if output:
             with open(output, "w") as f:
@@ -442,6 +443,8 @@ def export(campaign_id: int, output_format: str, output: Optional[str]):
 @cli.command()
 def types():
     """List available campaign types and their structures."""
+    from campaign_platform.campaigns.campaign_builder import CampaignBuilder
+
     summaries = CampaignBuilder.list_campaign_types()
 
     click.echo("\nAvailable Campaign Types:")
@@ -456,6 +459,17 @@ def types():
     click.echo()
 
 
+@cli.command()
+def migrate():
+    """Upgrade an existing database to the current schema."""
+    from campaign_platform.campaigns.models import get_engine, migrate_schema
+
+    engine = get_engine()
+    migrate_schema(engine)
+    engine.dispose()
+    click.echo("Database schema is up to date.")
+
+
 # --- Add Target ---
 
 
@@ -466,7 +480,7 @@ def types():
     "--type",
     "target_type",
     required=True,
-    type=click.Choice(["corporation", "executive", "legislator", "regulator", "facility", "brand", "investor"]),
+    type=TARGET_TYPE_CHOICES,
 )
 @click.option("--org", default=None, help="Organization")
 @click.option("--role", default=None, help="Title/role")
@@ -484,9 +498,11 @@ def add_target(
     vulnerability: float,
 ):
     """Add a target to a campaign."""
+    from campaign_platform.campaigns.models import Campaign, Target, TargetType
+
     db = get_db()
     try:
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+        campaign = db.get(Campaign, campaign_id)
         if not campaign:
             click.echo(f"Campaign {campaign_id} not found.", err=True)
             sys.exit(1)
@@ -497,7 +513,6 @@ def add_target(
         if phone:
             contacts["phone"] = phone
 
-        from campaign_platform.campaigns.models import TargetType
         target = Target(
             campaign_id=campaign_id,
             name=name,
@@ -523,6 +538,10 @@ def add_target(
 
 
 def main():
+    # `template` is a plain file read; skip building the full command group.
+    if len(sys.argv) > 1 and sys.argv[1] == "template":
+        template(args=sys.argv[2:], prog_name="campaign template")
+        return
     cli()
 
 
@@ -0,0 +1,60 @@
+"""
+Template viewing command.
+
+Kept separate from the main CLI so that `campaign template ...` is a plain
+file read: it never imports the models, and so never loads SQLAlchemy.
+
+Usage:
+    campaign template --type email --list
+    campaign template --type email --variant corporate_ceo
+"""
+
+import os
+import sys
+
+import click
+
+TEMPLATE_DIRS = {
+    "email": "email_templates",
+    "phone": "phone_scripts",
+    "social": "social_templates",
+    "review": "review_templates",
+}
+TEMPLATE_TYPE_CHOICES = click.Choice(("email", "phone", "social", "review"))
+
+
+@click.command()
+@click.option(
+    "--type",
+    "template_type",
+    required=True,
+    type=TEMPLATE_TYPE_CHOICES,
+    help="Template category",
+)
+@click.option("--variant", default=None, help="Specific template variant")
+@click.option("--list/--no-list", "list_templates", default=False, help="List available templates")
+def template(template_type: str, variant: str | None, list_templates: bool):
+    """View or list action templates."""
+    template_dir = os.path.join(
+        os.path.dirname(__file__), "templates", TEMPLATE_DIRS[template_type]
+    )
+
+    if list_templates or not variant:
+        if os.path.isdir(template_dir):
+            templates = [f for f in os.listdir(template_dir) if f.endswith(".txt")]
+            click.echo(f"\nAvailable {template_type} templates:")
+            for t in sorted(templates):
+                click.echo(f"  - {t.replace('.txt', '')}")
+            click.echo()
+        else:
+            click.echo(f"No templates found for {template_type}")
+        return
+
+    template_path = os.path.join(template_dir, f"{variant}.txt")
+    if not os.path.isfile(template_path):
+        click.echo(f"Template not found: {variant}", err=True)
+        click.echo("Use --list to see available templates.", err=True)
+        sys.exit(1)
+
+    with open(template_path) as f:
+        click.echo(f.read())
@@ -2,18 +2,30 @@
 FastAPI dashboard API - CRUD for campaigns, actions, targets, and progress tracking.
 """
 
-from datetime import datetime, date
-from typing import List, Optional, Dict, Any
-
-from fastapi import FastAPI, HTTPException, Depends, Query
-from fastapi.responses import HTMLResponse, FileResponse
+from contextlib import asynccontextmanager
+from datetime import datetime, date, timedelta
+from functools import lru_cache
+from collections.abc import AsyncIterator
+from typing import List, NoReturn, Optional, Dict, Any
+
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Depends, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, FileResponse, Response
 from fastapi.staticfiles import StaticFiles
+import msgspec
 from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, distinct, exists, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import selectinload
+import json
 import os
 
 from campaign_platform.campaigns.models import (
+    Base,
     Campaign,
+    CampaignMetricsSnapshot,
+    CampaignROISnapshot,
     Action,
     Target,
     Participant,
@@ -22,35 +34,67 @@ from campaign_platform.campaigns.models import (
     ActionType,
     ActionStatus,
     TargetType,
-    get_engine,
-    get_session,
-    create_tables,
+    action_counter_values,
+    action_totals_upsert,
+    get_async_engine,
+    UtcNow,
 )
 from campaign_platform.campaigns.campaign_builder import CampaignBuilder
 from campaign_platform.campaigns.action_generator import ActionGenerator
-from campaign_platform.metrics.impact_tracker import ImpactTracker
+from campaign_platform.metrics.impact_tracker import (
+    action_metric_rows,
+    compute_campaign_metrics,
+)
 from campaign_platform.metrics.roi_calculator import ROICalculator
+from campaign_platform.dashboard import cache
+
+# --- Database ---
+
+DATABASE_URL = os.environ.get("DATABASE_URL", "sqlite:///campaign_platform.db")
+
+# One pooled engine per process; connections are reused across requests.
+engine = get_async_engine(
+    DATABASE_URL,
+    pool_size=20,
+    max_overflow=10,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+)
+AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield
+    await engine.dispose()
+
 
 app = FastAPI(
     title="Campaign Coordination Platform",
     description="Coordinate campaigns. Multiply impact. Every volunteer gets the right action at the right time.",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
-# --- Database dependency ---
 
-_engine = None
+async def get_db() -> AsyncIterator[AsyncSession]:
+    async with AsyncSessionLocal() as session:
+        yield session
 
 
-def get_db() -> Session:
-    global _engine
-    if _engine is None:
-        _engine = create_tables()
-    session = get_session(_engine)
-    try:
-        yield session
-    finally:
-        session.close()
+async def get_campaign_or_404(db: AsyncSession, campaign_id: int) -> Campaign:
+    """Load a campaign with its actions (needed for completion_pct)."""
+    stmt = (
+        select(Campaign)
+        .options(selectinload(Campaign.actions))
+        .where(Campaign.id == campaign_id)
+    )
+    campaign = (await db.scalars(stmt)).first()
+    if not campaign:
+        raise HTTPException(status_code=404, detail="Campaign not found")
+    return campaign
 
 
 # --- Pydantic Schemas ---
@@ -192,6 +236,84 @@ class ProgressResponse(BaseModel):
     current_phase: Optional[int] = None
 
 
+# List endpoints encode through msgspec Structs mirroring the response models;
+# pydantic stays for request validation, and response_model on those routes
+# only documents the schema. Keep the fields in step with the models above.
+
+
+class CampaignOut(msgspec.Struct, kw_only=True):
+    id: int
+    name: str
+    slug: str
+    campaign_type: str
+    target_summary: str
+    goal: str
+    status: str
+    channels: list | None = None
+    tactics: list | None = None
+    escalation_ladder: list | None = None
+    win_conditions: list | None = None
+    start_date: date | None = None
+    deadline: date | None = None
+    completion_pct: float
+    created_at: datetime
+
+
+class ActionOut(msgspec.Struct, kw_only=True):
+    id: int
+    campaign_id: int
+    action_type: str
+    title: str
+    description: str
+    template_name: str | None = None
+    estimated_minutes: int
+    priority: int
+    status: str
+    deadline: datetime | None = None
+    assigned_to: int | None = None
+    completed_at: datetime | None = None
+    is_overdue: bool
+    created_at: datetime
+
+
+class TargetOut(msgspec.Struct, kw_only=True):
+    id: int
+    campaign_id: int
+    name: str
+    target_type: str
+    organization: str | None = None
+    title_role: str | None = None
+    contacts: dict | None = None
+    social_accounts: dict | None = None
+    vulnerability_score: float
+    vulnerability_factors: dict | None = None
+    notes: str | None = None
+
+
+class ParticipantOut(msgspec.Struct, kw_only=True):
+    id: int
+    name: str
+    email: str
+    skills: list | None = None
+    availability_minutes_per_week: int
+    actions_completed: int
+    actions_verified: int
+    total_impact_score: float
+    reliability_score: float
+
+
+_CAMPAIGN_LIST = list[CampaignOut]
+_ACTION_LIST = list[ActionOut]
+_TARGET_LIST = list[TargetOut]
+_PARTICIPANT_LIST = list[ParticipantOut]
+
+
+def json_list_response(list_type, rows) -> Response:
+    """Convert ORM rows to a list of Structs and encode them to JSON bytes."""
+    items = msgspec.convert(rows, list_type, from_attributes=True)
+    return Response(content=msgspec.json.encode(items), media_type="application/json")
+
+
 # --- Campaign Endpoints ---
 
 
@@ -205,7 +327,7 @@ async def root():
 
 
 @app.post("/api/campaigns", response_model=CampaignResponse)
-async def create_campaign(data: CampaignCreate, db: Session = Depends(get_db)):
+async def create_campaign(data: CampaignCreate, db: AsyncSession = Depends(get_db)):
     """Create a new campaign from a template."""
     campaign = CampaignBuilder.build_campaign(
         name=data.name,
@@ -215,8 +337,8 @@ async def create_campaign(data: CampaignCreate, db: Session = Depends(get_db)):
         start_date=data.start_date,
     )
     db.add(campaign)
-    db.commit()
-    db.refresh(campaign)
+    await db.commit()
+    await db.refresh(campaign, ["actions"])
     return campaign
 
 
@@ -224,79 +346,115 @@ async def create_campaign(data: CampaignCreate, db: Session = Depends(get_db)):
 async def list_campaigns(
     status: Optional[CampaignStatus] = None,
     campaign_type: Optional[CampaignType] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """List all campaigns, optionally filtered by status or type."""
-    query = db.query(Campaign)
+    stmt = select(Campaign).options(selectinload(Campaign.actions))
     if status:
-        query = query.filter(Campaign.status == status)
+        stmt = stmt.where(Campaign.status == status)
     if campaign_type:
-        query = query.filter(Campaign.campaign_type == campaign_type)
-    campaigns = query.order_by(Campaign.created_at.desc()).all()
-    return campaigns
+        stmt = stmt.where(Campaign.campaign_type == campaign_type)
+    campaigns = await db.scalars(stmt.order_by(Campaign.created_at.desc()))
+    return json_list_response(_CAMPAIGN_LIST, campaigns.all())
 
 
 @app.get("/api/campaigns/{campaign_id}", response_model=CampaignResponse)
-async def get_campaign(campaign_id: int, db: Session = Depends(get_db)):
+async def get_campaign(campaign_id: int, db: AsyncSession = Depends(get_db)):
     """Get a specific campaign by ID."""
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
-    if not campaign:
-        raise HTTPException(status_code=404, detail="Campaign not found")
-    return campaign
+
+    async def load():
+        campaign = await get_campaign_or_404(db, campaign_id)
+        return CampaignResponse.model_validate(campaign).model_dump(mode="json")
+
+    return await cache.get_or_compute(
+        cache.campaign_key(campaign_id), load, ttl=cache.CAMPAIGN_TTL
+    )
 
 
 @app.patch("/api/campaigns/{campaign_id}", response_model=CampaignResponse)
 async def update_campaign(
-    campaign_id: int, data: CampaignUpdate, db: Session = Depends(get_db)
+    campaign_id: int,
+    data: CampaignUpdate,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
 ):
     """Update a campaign's status, name, or goal."""
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
-    if not campaign:
-        raise HTTPException(status_code=404, detail="Campaign not found")
+    campaign = await get_campaign_or_404(db, campaign_id)
     if data.name is not None:
         campaign.name = data.name
     if data.status is not None:
         campaign.status = data.status
     if data.goal is not None:
         campaign.goal = data.goal
-    db.commit()
-    db.refresh(campaign)
+    await expire_metrics_snapshot(db, background_tasks, campaign_id)
+    await db.commit()
+    await cache.invalidate_campaign(campaign_id)
     return campaign
 
 
 @app.get("/api/campaigns/{campaign_id}/progress", response_model=ProgressResponse)
-async def get_campaign_progress(campaign_id: int, db: Session = Depends(get_db)):
+async def get_campaign_progress(campaign_id: int, db: AsyncSession = Depends(get_db)):
     """Get progress metrics for a campaign."""
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
-    if not campaign:
-        raise HTTPException(status_code=404, detail="Campaign not found")
+    return await cache.get_or_compute(
+        cache.progress_key(campaign_id), lambda: _compute_progress(db, campaign_id)
+    )
+
 
-    actions = db.query(Action).filter(Action.campaign_id == campaign_id).all()
-    completed = [a for a in actions if a.status in (ActionStatus.COMPLETED, ActionStatus.VERIFIED)]
-    verified = [a for a in actions if a.status == ActionStatus.VERIFIED]
-    overdue = [a for a in actions if a.is_overdue]
-    assigned_participants = set(a.assigned_to for a in actions if a.assigned_to)
-
-    return ProgressResponse(
-        campaign_id=campaign.id,
-        campaign_name=campaign.name,
-        total_actions=len(actions),
-        completed_actions=len(completed),
-        verified_actions=len(verified),
-        overdue_actions=len(overdue),
-        completion_pct=campaign.completion_pct,
-        participants_active=len(assigned_participants),
+async def _compute_progress(db: AsyncSession, campaign_id: int) -> dict:
+    # Totals come from the campaign's counters. Overdue depends on the clock
+    # and participants on assignments, so those two stay as subqueries.
+    done = (ActionStatus.COMPLETED, ActionStatus.VERIFIED)
+    overdue = (
+        select(func.count())
+        .where(
+            Action.campaign_id == Campaign.id,
+            Action.deadline < UtcNow(),
+            Action.status.notin_(done),
+        )
+        .scalar_subquery()
+    )
+    participants = (
+        select(func.count(distinct(Action.assigned_to)))
+        .where(Action.campaign_id == Campaign.id)
+        .scalar_subquery()
+    )
+    stmt = select(
+        Campaign.name,
+        Campaign.total_actions,
+        Campaign.completed_actions,
+        Campaign.verified_actions,
+        overdue,
+        participants,
+    ).where(Campaign.id == campaign_id)
+    row = (await db.execute(stmt)).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Campaign not found")
+    name, total, completed, verified, overdue_count, participant_count = row
+
+    progress = ProgressResponse(
+        campaign_id=campaign_id,
+        campaign_name=name,
+        total_actions=total,
+        completed_actions=completed,
+        verified_actions=verified,
+        overdue_actions=overdue_count,
+        completion_pct=round(completed / total * 100, 1) if total else 0.0,
+        participants_active=participant_count,
     )
+    return progress.model_dump()
 
 
 # --- Action Endpoints ---
 
 
 @app.post("/api/actions", response_model=ActionResponse)
-async def create_action(data: ActionCreate, db: Session = Depends(get_db)):
+async def create_action(
+    data: ActionCreate,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+):
     """Create a new action for a campaign."""
-    campaign = db.query(Campaign).filter(Campaign.id == data.campaign_id).first()
-    if not campaign:
+    if not await db.scalar(select(exists().where(Campaign.id == data.campaign_id))):
         raise HTTPException(status_code=404, detail="Campaign not found")
     action = Action(
         campaign_id=data.campaign_id,
@@ -309,8 +467,10 @@ async def create_action(data: ActionCreate, db: Session = Depends(get_db)):
         deadline=data.deadline,
     )
     db.add(action)
-    db.commit()
-    db.refresh(action)
+    await expire_metrics_snapshot(db, background_tasks, data.campaign_id)
+    await db.commit()
+    await db.refresh(action)
+    await cache.invalidate_campaign(action.campaign_id)
     return action
 
 
@@ -320,100 +480,200 @@ async def list_actions(
     status: Optional[ActionStatus] = None,
     action_type: Optional[ActionType] = None,
     max_minutes: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """List actions with optional filters."""
-    query = db.query(Action)
+    stmt = select(Action)
     if campaign_id:
-        query = query.filter(Action.campaign_id == campaign_id)
+        stmt = stmt.where(Action.campaign_id == campaign_id)
     if status:
-        query = query.filter(Action.status == status)
+        stmt = stmt.where(Action.status == status)
     if action_type:
-        query = query.filter(Action.action_type == action_type)
+        stmt = stmt.where(Action.action_type == action_type)
     if max_minutes:
-        query = query.filter(Action.estimated_minutes <= max_minutes)
-    return query.order_by(Action.priority.asc()).all()
+        stmt = stmt.where(Action.estimated_minutes <= max_minutes)
+    actions = await db.scalars(stmt.order_by(Action.priority.asc()))
+    return json_list_response(_ACTION_LIST, actions.all())
+
+
+async def _action_missing_or_conflict(
+    db: AsyncSession, action_id: int, detail: str
+) -> NoReturn:
+    """Raise 404 or 409 for a guarded action update that matched no row."""
+    if await db.scalar(select(exists().where(Action.id == action_id))):
+        raise HTTPException(status_code=409, detail=detail)
+    raise HTTPException(status_code=404, detail="Action not found")
+
+
+def _chained_update(action_stmt, campaign_values: dict, participant_values: dict):
+    """
+    The PostgreSQL form of _update_action_and_assignee: the campaign and
+    assignee UPDATEs run as data-modifying CTEs keyed on the action UPDATE's
+    RETURNING row, and the outer SELECT returns that row.
+    """
+    upd = action_stmt.cte("upd")
+    bump_campaign = (
+        update(Campaign)
+        .where(Campaign.id == upd.c.campaign_id)
+        .values(**campaign_values)
+        .cte("bump_campaign")
+    )
+    bump_participant = (
+        update(Participant)
+        .where(Participant.id == upd.c.assigned_to)
+        .values(**participant_values)
+        .cte("bump_participant")
+    )
+    return select(*upd.c).add_cte(bump_campaign, bump_participant)
+
+
+async def _update_action_and_assignee(
+    db: AsyncSession, action_stmt, campaign_values: dict, **participant_values
+):
+    """
+    Run a guarded action UPDATE ... RETURNING (campaign_id, assigned_to, ...),
+    then apply campaign_values to its campaign and participant_values to the
+    assignee, if any, in the same transaction. Returns the RETURNING row.
+
+    PostgreSQL does all three in one round-trip through data-modifying CTEs.
+    SQLite cannot nest an UPDATE in WITH, so there they are separate statements.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        stmt = _chained_update(action_stmt, campaign_values, participant_values)
+        return (await db.execute(stmt)).first()
+
+    row = (await db.execute(action_stmt)).first()
+    if row is None:
+        return None
+    await db.execute(
+        update(Campaign).where(Campaign.id == row.campaign_id).values(**campaign_values)
+    )
+    if row.assigned_to:
+        await db.execute(
+            update(Participant)
+            .where(Participant.id == row.assigned_to)
+            .values(**participant_values)
+        )
+    return row
 
 
 @app.post("/api/actions/{action_id}/claim")
 async def claim_action(
-    action_id: int, participant_id: int, db: Session = Depends(get_db)
+    action_id: int, participant_id: int, db: AsyncSession = Depends(get_db)
 ):
     """Claim an action for a participant."""
-    action = db.query(Action).filter(Action.id == action_id).first()
-    if not action:
-        raise HTTPException(status_code=404, detail="Action not found")
-    if action.status != ActionStatus.AVAILABLE:
-        raise HTTPException(status_code=400, detail="Action not available")
-    participant = db.query(Participant).filter(Participant.id == participant_id).first()
-    if not participant:
+    if not await db.scalar(select(exists().where(Participant.id == participant_id))):
         raise HTTPException(status_code=404, detail="Participant not found")
-    action.status = ActionStatus.CLAIMED
-    action.assigned_to = participant_id
-    db.commit()
+    # The status guard and the write are one statement, so concurrent
+    # claimants cannot both see the action as available.
+    stmt = (
+        update(Action)
+        .where(Action.id == action_id, Action.status == ActionStatus.AVAILABLE)
+        .values(status=ActionStatus.CLAIMED, assigned_to=participant_id)
+        .returning(Action.campaign_id)
+    )
+    campaign_id = (await db.execute(stmt)).scalar()
+    if campaign_id is None:
+        await _action_missing_or_conflict(db, action_id, "Action not available")
+    await db.commit()
+    await cache.invalidate_campaign(campaign_id)
     return {"status": "claimed", "action_id": action_id, "participant_id": participant_id}
 
 
 @app.post("/api/actions/{action_id}/complete")
 async def complete_action(
     action_id: int,
+    background_tasks: BackgroundTasks,
     verification_url: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Mark an action as completed."""
-    action = db.query(Action).filter(Action.id == action_id).first()
-    if not action:
-        raise HTTPException(status_code=404, detail="Action not found")
-    action.status = ActionStatus.COMPLETED
-    action.completed_at = datetime.utcnow()
+    # Timestamps come from the database clock, shared by both updates
+    values = {"status": ActionStatus.COMPLETED, "completed_at": UtcNow()}
     if verification_url:
-        action.verification_url = verification_url
-    if action.assigned_to:
-        participant = db.query(Participant).filter(
-            Participant.id == action.assigned_to
-        ).first()
-        if participant:
-            participant.actions_completed += 1
-            participant.last_active = datetime.utcnow()
-    db.commit()
+        values["verification_url"] = verification_url
+    stmt = (
+        update(Action)
+        .where(
+            Action.id == action_id,
+            Action.status.notin_((ActionStatus.COMPLETED, ActionStatus.VERIFIED)),
+        )
+        .values(**values)
+        .returning(
+            Action.campaign_id,
+            Action.assigned_to,
+            Action.action_type,
+            Action.estimated_minutes,
+        )
+    )
+    # The guard excludes completed/verified actions, so this is always a
+    # not-done -> done transition
+    row = await _update_action_and_assignee(
+        db,
+        stmt,
+        action_counter_values(completed=1),
+        actions_completed=Participant.actions_completed + 1,
+        last_active=UtcNow(),
+    )
+    if row is None:
+        await _action_missing_or_conflict(db, action_id, "Action already completed")
+    # A bulk UPDATE skips the ORM listeners that maintain the per-type totals
+    await db.execute(
+        action_totals_upsert(
+            db.get_bind().dialect.name,
+            row.campaign_id,
+            row.action_type,
+            completed_count=1,
+            completed_minutes=row.estimated_minutes or 0,
+        )
+    )
+    await expire_metrics_snapshot(db, background_tasks, row.campaign_id)
+    await db.commit()
+    await cache.invalidate_campaign(row.campaign_id)
     return {"status": "completed", "action_id": action_id}
 
 
 @app.post("/api/actions/{action_id}/verify")
-async def verify_action(action_id: int, db: Session = Depends(get_db)):
+async def verify_action(
+    action_id: int, background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_db)
+):
     """Verify a completed action."""
-    action = db.query(Action).filter(Action.id == action_id).first()
-    if not action:
-        raise HTTPException(status_code=404, detail="Action not found")
-    if action.status != ActionStatus.COMPLETED:
-        raise HTTPException(status_code=400, detail="Action must be completed first")
-    action.status = ActionStatus.VERIFIED
-    if action.assigned_to:
-        participant = db.query(Participant).filter(
-            Participant.id == action.assigned_to
-        ).first()
-        if participant:
-            participant.actions_verified += 1
-    db.commit()
+    stmt = (
+        update(Action)
+        .where(Action.id == action_id, Action.status == ActionStatus.COMPLETED)
+        .values(status=ActionStatus.VERIFIED)
+        .returning(Action.campaign_id, Action.assigned_to)
+    )
+    row = await _update_action_and_assignee(
+        db,
+        stmt,
+        action_counter_values(verified=1),
+        actions_verified=Participant.actions_verified + 1,
+    )
+    if row is None:
+        await _action_missing_or_conflict(db, action_id, "Action must be completed first")
+    await expire_metrics_snapshot(db, background_tasks, row.campaign_id)
+    await db.commit()
+    await cache.invalidate_campaign(row.campaign_id)
     return {"status": "verified", "action_id": action_id}
 
 
 @app.post("/api/actions/suggest", response_model=List[dict])
-async def suggest_actions(data: ActionSuggestionRequest, db: Session = Depends(get_db)):
+async def suggest_actions(data: ActionSuggestionRequest, db: AsyncSession = Depends(get_db)):
     """Suggest actions for a volunteer based on available time."""
-    campaign = db.query(Campaign).filter(Campaign.id == data.campaign_id).first()
+    campaign = await db.get(Campaign, data.campaign_id)
     if not campaign:
         raise HTTPException(status_code=404, detail="Campaign not found")
 
     participant = None
     if data.participant_id:
-        participant = db.query(Participant).filter(
-            Participant.id == data.participant_id
-        ).first()
+        participant = await db.get(Participant, data.participant_id)
 
-    targets = db.query(Target).filter(Target.campaign_id == data.campaign_id).all()
+    targets = await get_cached_targets(db, data.campaign_id)
 
-    specs = ActionGenerator.generate_for_time(
+    # Scoring and template rendering are CPU-bound; keep them off the event loop
+    specs = await run_in_threadpool(
+        ActionGenerator.generate_for_time,
         campaign=campaign,
         minutes_available=data.minutes_available,
         targets=targets,
@@ -433,19 +693,42 @@ async def suggest_actions(data: ActionSuggestionRequest, db: Session = Depends(g
     ]
 
 
+async def get_cached_targets(db: AsyncSession, campaign_id: int) -> list[Target]:
+    """A campaign's targets, shared between workers through the cache.
+
+    Cached entries come back as detached Target instances built from the
+    serialized columns; they are only read, never added to the session.
+    """
+
+    stmt = select(Target).where(Target.campaign_id == campaign_id)
+    if cache.get_client() is None:
+        return list((await db.scalars(stmt)).all())
+
+    async def load():
+        rows = (await db.scalars(stmt)).all()
+        return msgspec.to_builtins(
+            msgspec.convert(rows, _TARGET_LIST, from_attributes=True)
+        )
+
+    rows = await cache.get_or_compute(
+        cache.targets_key(campaign_id), load, ttl=cache.TARGETS_TTL
+    )
+    return [Target(**row) for row in rows]
+
+
 # --- Target Endpoints ---
 
 
 @app.post("/api/targets", response_model=TargetResponse)
-async def create_target(data: TargetCreate, db: Session = Depends(get_db)):
+async def create_target(data: TargetCreate, db: AsyncSession = Depends(get_db)):
     """Add a target to a campaign."""
-    campaign = db.query(Campaign).filter(Campaign.id == data.campaign_id).first()
-    if not campaign:
+    if not await db.scalar(select(exists().where(Campaign.id == data.campaign_id))):
         raise HTTPException(status_code=404, detail="Campaign not found")
     target = Target(**data.model_dump())
     db.add(target)
-    db.commit()
-    db.refresh(target)
+    await db.commit()
+    await db.refresh(target)
+    await cache.invalidate(cache.targets_key(data.campaign_id))
     return target
 
 
@@ -453,43 +736,44 @@ async def create_target(data: TargetCreate, db: Session = Depends(get_db)):
 async def list_targets(
     campaign_id: Optional[int] = None,
     target_type: Optional[TargetType] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """List targets, optionally filtered."""
-    query = db.query(Target)
+    stmt = select(Target)
     if campaign_id:
-        query = query.filter(Target.campaign_id == campaign_id)
+        stmt = stmt.where(Target.campaign_id == campaign_id)
     if target_type:
-        query = query.filter(Target.target_type == target_type)
-    return query.all()
+        stmt = stmt.where(Target.target_type == target_type)
+    return json_list_response(_TARGET_LIST, (await db.scalars(stmt)).all())
 
 
 # --- Participant Endpoints ---
 
 
 @app.post("/api/participants", response_model=ParticipantResponse)
-async def create_participant(data: ParticipantCreate, db: Session = Depends(get_db)):
+async def create_participant(data: ParticipantCreate, db: AsyncSession = Depends(get_db)):
     """Register a new participant."""
-    existing = db.query(Participant).filter(Participant.email == data.email).first()
+    existing = await db.scalar(select(Participant).where(Participant.email == data.email))
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
     participant = Participant(**data.model_dump())
     db.add(participant)
-    db.commit()
-    db.refresh(participant)
+    await db.commit()
+    await db.refresh(participant)
     return participant
 
 
 @app.get("/api/participants", response_model=List[ParticipantResponse])
-async def list_participants(db: Session = Depends(get_db)):
+async def list_participants(db: AsyncSession = Depends(get_db)):
     """List all participants."""
-    return db.query(Participant).order_by(Participant.actions_completed.desc()).all()
+    stmt = select(Participant).order_by(Participant.actions_completed.desc())
+    return json_list_response(_PARTICIPANT_LIST, (await db.scalars(stmt)).all())
 
 
 @app.get("/api/participants/{participant_id}", response_model=ParticipantResponse)
-async def get_participant(participant_id: int, db: Session = Depends(get_db)):
+async def get_participant(participant_id: int, db: AsyncSession = Depends(get_db)):
     """Get a specific participant."""
-    participant = db.query(Participant).filter(Participant.id == participant_id).first()
+    participant = await db.get(Participant, participant_id)
     if not participant:
         raise HTTPException(status_code=404, detail="Participant not found")
     return participant
@@ -501,29 +785,115 @@ async def get_participant(participant_id: int, db: Session = Depends(get_db)):
 @app.get("/api/templates/campaign-types")
 async def list_campaign_types():
     """List available campaign types and their structures."""
+    return _campaign_types()
+
+
+@lru_cache(maxsize=1)
+def _campaign_types() -> list:
+    # Built from the static CAMPAIGN_STRUCTURES table; call
+    # _campaign_types.cache_clear() if that table is reloaded.
     return CampaignBuilder.list_campaign_types()
 
 
 # --- Metrics Endpoints ---
 
 
+# Overdue counts and velocity drift with the clock, so even an untouched
+# snapshot is recomputed after this long
+METRICS_SNAPSHOT_MAX_AGE = timedelta(minutes=5)
+
+
+async def store_metrics_snapshot(db: AsyncSession, campaign_id: int) -> dict | None:
+    """Compute a campaign's metrics and upsert them into the snapshot table."""
+    campaign = await db.get(Campaign, campaign_id)
+    if not campaign:
+        return None
+    # Stream (type, status, completed_at, overdue) tuples rather than
+    # hydrating every Action into the identity map
+    metrics = await db.run_sync(
+        lambda session: compute_campaign_metrics(
+            campaign, session.execute(action_metric_rows(campaign_id)), db=session
+        )
+    )
+    payload = metrics.to_dict()
+    await db.merge(
+        CampaignMetricsSnapshot(
+            campaign_id=campaign_id, metrics=payload, computed_at=datetime.utcnow()
+        )
+    )
+    try:
+        await db.commit()
+    except IntegrityError:
+        # A concurrent refresh inserted the row first; its result is as fresh
+        await db.rollback()
+    return payload
+
+
+async def refresh_metrics_snapshot(campaign_id: int) -> None:
+    """Background task: rebuild a campaign's snapshot after a write."""
+    async with AsyncSessionLocal() as db:
+        await store_metrics_snapshot(db, campaign_id)
+    # A read between the write and this refresh may have cached a recompute
+    await cache.invalidate(cache.metrics_key(campaign_id))
+
+
+async def store_roi_snapshot(db: AsyncSession, campaign_id: int) -> dict | None:
+    """Compute a campaign's ROI and upsert it into the snapshot table."""
+    campaign = await db.get(Campaign, campaign_id)
+    if not campaign:
+        return None
+    calculator = ROICalculator()
+    # Column tuples only; the campaign's actions are never loaded as objects
+    roi = await db.run_sync(lambda session: calculator.refresh_snapshot(session, campaign))
+    try:
+        await db.commit()
+    except IntegrityError:
+        # A concurrent refresh inserted the row first; its result is as fresh
+        await db.rollback()
+    return roi
+
+
+async def refresh_roi_snapshot(campaign_id: int) -> None:
+    """Background task: rebuild a campaign's ROI snapshot after a write."""
+    async with AsyncSessionLocal() as db:
+        await store_roi_snapshot(db, campaign_id)
+
+
+async def expire_metrics_snapshot(
+    db: AsyncSession, background_tasks: BackgroundTasks, campaign_id: int
+) -> None:
+    """Drop a campaign's snapshots in the caller's transaction and queue rebuilds."""
+    for snapshot in (CampaignMetricsSnapshot, CampaignROISnapshot):
+        await db.execute(delete(snapshot).where(snapshot.campaign_id == campaign_id))
+    background_tasks.add_task(refresh_metrics_snapshot, campaign_id)
+    background_tasks.add_task(refresh_roi_snapshot, campaign_id)
+
+
 @app.get("/api/metrics/{campaign_id}")
-async def get_campaign_metrics(campaign_id: int, db: Session = Depends(get_db)):
+async def get_campaign_metrics(campaign_id: int, db: AsyncSession = Depends(get_db)):
     """Get impact metrics for a campaign."""
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
-    if not campaign:
-        raise HTTPException(status_code=404, detail="Campaign not found")
-    actions = db.query(Action).filter(Action.campaign_id == campaign_id).all()
-    tracker = ImpactTracker()
-    return tracker.compute_campaign_metrics(campaign, actions)
+
+    async def load():
+        snapshot = await db.get(CampaignMetricsSnapshot, campaign_id)
+        if snapshot and datetime.utcnow() - snapshot.computed_at < METRICS_SNAPSHOT_MAX_AGE:
+            return snapshot.metrics
+        metrics = await store_metrics_snapshot(db, campaign_id)
+        if metrics is None:
+            raise HTTPException(status_code=404, detail="Campaign not found")
+        return metrics
+
+    metrics = await cache.get_or_compute(cache.metrics_key(campaign_id), load)
+    # Plain dict of JSON types: skip jsonable_encoder and encode directly
+    return Response(content=json.dumps(metrics), media_type="application/json")
 
 
 @app.get("/api/metrics/{campaign_id}/roi")
-async def get_campaign_roi(campaign_id: int, db: Session = Depends(get_db)):
+async def get_campaign_roi(campaign_id: int, db: AsyncSession = Depends(get_db)):
     """Get ROI analysis for a campaign."""
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
-    if not campaign:
+    snapshot = await db.get(CampaignROISnapshot, campaign_id)
+    if snapshot and datetime.utcnow() - snapshot.computed_at < METRICS_SNAPSHOT_MAX_AGE:
+        return snapshot.roi
+    roi = await store_roi_snapshot(db, campaign_id)
+    if roi is None:
         raise HTTPException(status_code=404, detail="Campaign not found")
-    actions = db.query(Action).filter(Action.campaign_id == campaign_id).all()
-    calculator = ROICalculator()
-    return calculator.calculate_campaign_roi(campaign, actions)
+    return roi
@@ -0,0 +1,133 @@
+"""
+Response cache for read-heavy dashboard endpoints.
+
+Backed by Redis when REDIS_URL is set and the `redis` package is installed
+(`pip install campaign-platform[cache]`). Without either, every lookup is a
+miss and endpoints read straight from the database. Redis errors are logged
+and treated the same way: the cache must never take the dashboard down.
+
+On a miss, `get_or_compute` lets only one request per key and worker run the
+query; concurrent requests for the same key wait and then read its result.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+try:
+    import redis.asyncio as redis
+except ImportError:  # optional dependency
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.environ.get("REDIS_URL")
+
+# Seconds a cached metrics/progress response stays valid
+METRICS_TTL = 60
+# Campaign details change only through PATCH, which invalidates them
+CAMPAIGN_TTL = 300
+TARGETS_TTL = 120
+
+_client = None
+# Per-key compute locks and how many requests hold or await each; a lock is
+# dropped only when nobody references it any more
+_locks: dict[str, asyncio.Lock] = {}
+_lock_users: dict[str, int] = {}
+
+
+def get_client():
+    """Return the shared Redis client, or None when caching is disabled."""
+    global _client
+    if _client is None and redis is not None and REDIS_URL:
+        _client = redis.Redis.from_url(REDIS_URL)
+    return _client
+
+
+def campaign_key(campaign_id: int) -> str:
+    return f"campaign:{campaign_id}"
+
+
+def targets_key(campaign_id: int) -> str:
+    return f"campaign:{campaign_id}:targets"
+
+
+def metrics_key(campaign_id: int) -> str:
+    return f"campaign:{campaign_id}:metrics"
+
+
+def progress_key(campaign_id: int) -> str:
+    return f"campaign:{campaign_id}:progress"
+
+
+async def get_json(key: str) -> Any | None:
+    """Fetch and decode a cached value; None on miss or cache failure."""
+    client = get_client()
+    if client is None:
+        return None
+    try:
+        cached = await client.get(key)
+    except Exception as e:
+        logger.warning("Cache read failed for %s: %s", key, e)
+        return None
+    return json.loads(cached) if cached is not None else None
+
+
+async def set_json(key: str, value: Any, ttl: int = METRICS_TTL) -> None:
+    """Store a JSON-serializable value with a TTL."""
+    client = get_client()
+    if client is None:
+        return
+    try:
+        await client.setex(key, ttl, json.dumps(value, default=str))
+    except Exception as e:
+        logger.warning("Cache write failed for %s: %s", key, e)
+
+
+async def get_or_compute(
+    key: str, compute: Callable[[], Awaitable[Any]], ttl: int = METRICS_TTL
+) -> Any:
+    """Return the cached value for key, computing and storing it on a miss."""
+    if get_client() is None:
+        return await compute()
+    value = await get_json(key)
+    if value is not None:
+        return value
+    lock = _locks.setdefault(key, asyncio.Lock())
+    _lock_users[key] = _lock_users.get(key, 0) + 1
+    try:
+        async with lock:
+            # Another request may have filled the key while we waited
+            value = await get_json(key)
+            if value is None:
+                value = await compute()
+                await set_json(key, value, ttl)
+    finally:
+        # release() clears locked() before a queued waiter runs, so count
+        # users instead of checking the lock
+        _lock_users[key] -= 1
+        if not _lock_users[key]:
+            del _lock_users[key]
+            del _locks[key]
+    return value
+
+
+async def invalidate(*keys: str) -> None:
+    """Delete cached entries so the next read recomputes them."""
+    client = get_client()
+    if client is None or not keys:
+        return
+    try:
+        await client.delete(*keys)
+    except Exception as e:
+        logger.warning("Cache invalidation failed for %s: %s", keys, e)
+
+
+async def invalidate_campaign(campaign_id: int) -> None:
+    """Drop every cached aggregate derived from a campaign's actions."""
+    await invalidate(
+        campaign_key(campaign_id), metrics_key(campaign_id), progress_key(campaign_id)
+    )
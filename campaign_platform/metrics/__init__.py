@@ -1,4 +1,10 @@
-from .impact_tracker import ImpactTracker
-from .roi_calculator import ROICalculator
+from .impact_tracker import CampaignMetrics, ImpactTracker, compute_campaign_metrics
+from .roi_calculator import CampaignROIContext, ROICalculator
 
-__all__ = ["ImpactTracker", "ROICalculator"]
+__all__ = [
+    "CampaignMetrics",
+    "CampaignROIContext",
+    "ImpactTracker",
+    "ROICalculator",
+    "compute_campaign_metrics",
+]
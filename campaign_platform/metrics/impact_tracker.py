@@ -6,11 +6,23 @@ media coverage instances, and corporate/government responses.
 
 Every metric ties back to the question: did this action move the target
 closer to our goal?
+
+The computations are plain module functions returning frozen dataclasses;
+`ImpactTracker` wraps them for callers that expect nested dicts.
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from collections import defaultdict, Counter
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Dict, List, Any
+from collections import Counter
+from collections.abc import Iterable
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import Date, Select, and_, func, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.functions import FunctionElement
 
 from campaign_platform.campaigns.models import (
     Campaign,
@@ -18,304 +30,531 @@ from campaign_platform.campaigns.models import (
     ActionType,
     ActionStatus,
     CampaignStatus,
+    UtcNow,
 )
 
 
-class ImpactTracker:
-    """Track and analyze impact metrics across campaigns."""
-
-    # Weight factors for different action types in impact scoring
-    # Higher weight = more pressure per action
-    ACTION_IMPACT_WEIGHTS: Dict[ActionType, float] = {
-        ActionType.PHONE_CALL: 3.0,       # Direct human contact, logged by offices
-        ActionType.EMAIL: 1.0,             # Baseline unit
-        ActionType.SOCIAL_POST: 0.5,       # Volume-dependent, low individual impact
-        ActionType.PUBLIC_COMMENT: 5.0,    # Legally must be addressed if substantive
-        ActionType.FOIA_REQUEST: 8.0,      # Creates legal obligation, yields intel
-        ActionType.REVIEW: 2.0,            # Visible to consumers, persistent
-        ActionType.TESTIMONY: 10.0,        # Direct legislative impact, public record
-        ActionType.SHAREHOLDER_ACTION: 12.0,  # Board-level pressure
-        ActionType.BOYCOTT: 1.5,           # Collective impact
-        ActionType.CONTENT_CREATION: 2.0,  # Narrative impact, variable reach
-        ActionType.SEO_ARTICLE: 3.0,       # Long-term discoverability
-        ActionType.OSINT_RESEARCH: 6.0,    # Enables other high-impact actions
-        ActionType.SATELLITE_ANALYSIS: 7.0,  # Hard evidence, hard to dispute
-        ActionType.CITIZEN_SUIT: 15.0,     # Maximum legal pressure
+# Weight factors for different action types in impact scoring
+# Higher weight = more pressure per action
+ACTION_IMPACT_WEIGHTS: dict[ActionType, float] = {
+    ActionType.PHONE_CALL: 3.0,       # Direct human contact, logged by offices
+    ActionType.EMAIL: 1.0,             # Baseline unit
+    ActionType.SOCIAL_POST: 0.5,       # Volume-dependent, low individual impact
+    ActionType.PUBLIC_COMMENT: 5.0,    # Legally must be addressed if substantive
+    ActionType.FOIA_REQUEST: 8.0,      # Creates legal obligation, yields intel
+    ActionType.REVIEW: 2.0,            # Visible to consumers, persistent
+    ActionType.TESTIMONY: 10.0,        # Direct legislative impact, public record
+    ActionType.SHAREHOLDER_ACTION: 12.0,  # Board-level pressure
+    ActionType.BOYCOTT: 1.5,           # Collective impact
+    ActionType.CONTENT_CREATION: 2.0,  # Narrative impact, variable reach
+    ActionType.SEO_ARTICLE: 3.0,       # Long-term discoverability
+    ActionType.OSINT_RESEARCH: 6.0,    # Enables other high-impact actions
+    ActionType.SATELLITE_ANALYSIS: 7.0,  # Hard evidence, hard to dispute
+    ActionType.CITIZEN_SUIT: 15.0,     # Maximum legal pressure
+}
+
+# Channel each action type applies pressure through
+ACTION_CHANNELS: dict[ActionType, str] = {
+    ActionType.EMAIL: "email",
+    ActionType.PHONE_CALL: "phone",
+    ActionType.SOCIAL_POST: "social_media",
+    ActionType.PUBLIC_COMMENT: "regulatory",
+    ActionType.FOIA_REQUEST: "legal",
+    ActionType.REVIEW: "consumer",
+    ActionType.TESTIMONY: "grassroots",
+    ActionType.SHAREHOLDER_ACTION: "shareholder",
+    ActionType.CONTENT_CREATION: "media",
+    ActionType.SEO_ARTICLE: "media",
+    ActionType.CITIZEN_SUIT: "legal",
+}
+
+
+# --- Result types ---
+
+
+@dataclass(frozen=True, slots=True)
+class MetricsSummary:
+    total_actions: int
+    completed: int
+    verified: int
+    overdue: int
+    completion_rate: float
+    verification_rate: float
+
+
+@dataclass(frozen=True, slots=True)
+class ActivityCounts:
+    emails_sent: int
+    calls_made: int
+    comments_filed: int
+    reviews_posted: int
+    foia_filed: int
+    testimonies_given: int
+    social_posts: int
+
+
+@dataclass(frozen=True, slots=True)
+class ImpactScore:
+    total_impact_score: float
+    impact_per_action: float
+    velocity_per_week: float
+
+
+@dataclass(frozen=True, slots=True)
+class ChannelCoverage:
+    active: list[str]
+    total_possible: int
+    coverage_pct: float
+
+
+@dataclass(frozen=True, slots=True)
+class TypeStats:
+    total: int
+    completed: int
+    completion_rate: float
+
+
+@dataclass(frozen=True, slots=True)
+class WeekCount:
+    week: str
+    actions_completed: int
+
+
+@dataclass(frozen=True, slots=True)
+class CampaignMetrics:
+    campaign_id: int
+    campaign_name: str
+    summary: MetricsSummary
+    activity_counts: ActivityCounts
+    impact: ImpactScore
+    channels: ChannelCoverage
+    type_breakdown: dict[ActionType, TypeStats]
+    weekly_timeline: list[WeekCount]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Nested plain-dict form, as served by the metrics endpoint."""
+        return asdict(self)
+
+
+# --- Campaign metrics ---
+
+
+def compute_campaign_metrics(
+    campaign: Campaign,
+    actions: Iterable[Any],
+    db: Session | None = None,
+) -> CampaignMetrics:
+    """
+    Compute comprehensive impact metrics for a campaign.
+
+    Covers:
+    - action_counts: breakdown by type
+    - completion_rates: overall and by type
+    - impact_score: weighted impact total
+    - velocity: actions per week
+    - channel_coverage: which channels are active
+    - timeline: weekly action counts
+
+    `actions` may be Action instances or rows from `action_metric_rows`;
+    only action_type, status, completed_at and is_overdue are read, in a
+    single pass, so a streaming result can be passed straight in.
+
+    When a session is given, the weekly timeline is aggregated in the
+    database instead of from the completion timestamps in `actions`.
+    """
+    weekly_timeline = _query_weekly_timeline(db, campaign.id) if db is not None else None
+    return _metrics_from_frame(campaign, _actions_frame(actions), weekly_timeline)
+
+
+def _actions_frame(actions: Iterable[Any], with_campaign: bool = False) -> pd.DataFrame:
+    """One row per action with the columns the metrics read, built in one pass."""
+    campaign_ids, types, statuses, completed_at, overdue = [], [], [], [], []
+    for a in actions:
+        if with_campaign:
+            campaign_ids.append(a.campaign_id)
+        types.append(a.action_type)
+        statuses.append(a.status)
+        completed_at.append(a.completed_at)
+        overdue.append(a.is_overdue)
+    # Enum columns stay object dtype so comparisons see the enum members
+    df = pd.DataFrame({
+        "t": pd.Series(types, dtype=object),
+        "s": pd.Series(statuses, dtype=object),
+        "c": completed_at,
+        "overdue": pd.Series(overdue, dtype=bool),
+    })
+    if with_campaign:
+        df["campaign_id"] = campaign_ids
+    return df
+
+
+def _metrics_from_frame(
+    campaign: Campaign,
+    df: pd.DataFrame,
+    weekly_timeline: list[WeekCount] | None = None,
+) -> CampaignMetrics:
+    done = (ActionStatus.COMPLETED, ActionStatus.VERIFIED)
+    completed_mask = df["s"].isin(done)
+    n_actions = len(df)
+    n_completed = int(completed_mask.sum())
+    n_verified = int((df["s"] == ActionStatus.VERIFIED).sum())
+
+    # Action counts by type (first-seen order, as plain ints)
+    type_counts = {
+        t: int(n) for t, n in df["t"].value_counts(sort=False).items()
+    }
+    completed_type_counts = {
+        t: int(n)
+        for t, n in df.loc[completed_mask, "t"].value_counts(sort=False).items()
     }
 
-    def compute_campaign_metrics(
-        self,
-        campaign: Campaign,
-        actions: List[Action],
-    ) -> Dict[str, Any]:
-        """
-        Compute comprehensive impact metrics for a campaign.
-
-        Returns a dictionary with:
-        - action_counts: breakdown by type
-        - completion_rates: overall and by type
-        - impact_score: weighted impact total
-        - velocity: actions per week
-        - channel_coverage: which channels are active
-        - timeline: weekly action counts
-        """
-        completed = [
-            a for a in actions
-            if a.status in (ActionStatus.COMPLETED, ActionStatus.VERIFIED)
-        ]
-        verified = [a for a in actions if a.status == ActionStatus.VERIFIED]
-
-        # Action counts by type
-        type_counts = Counter()
-        completed_type_counts = Counter()
-        for a in actions:
-            type_counts[a.action_type] += 1
-        for a in completed:
-            completed_type_counts[a.action_type] += 1
-
-        # Specific activity metrics
-        emails_sent = completed_type_counts.get(ActionType.EMAIL, 0)
-        calls_made = completed_type_counts.get(ActionType.PHONE_CALL, 0)
-        comments_filed = completed_type_counts.get(ActionType.PUBLIC_COMMENT, 0)
-        reviews_posted = completed_type_counts.get(ActionType.REVIEW, 0)
-        foia_filed = completed_type_counts.get(ActionType.FOIA_REQUEST, 0)
-        testimonies = completed_type_counts.get(ActionType.TESTIMONY, 0)
-        social_posts = completed_type_counts.get(ActionType.SOCIAL_POST, 0)
-
-        # Impact score
-        total_impact = sum(
-            self.ACTION_IMPACT_WEIGHTS.get(ActionType(a.action_type), 1.0)
-            for a in completed
+    # Impact score: action types as dense ordinals into the weight table
+    codes = (
+        df.loc[completed_mask, "t"].map(_TYPE_TO_IDX).to_numpy(dtype=np.intp)
+    )
+    total_impact = float(_WEIGHTS_ARR[codes].sum())
+
+    # Velocity (actions per week since campaign start)
+    if campaign.start_date and n_completed:
+        days_active = max(1, (datetime.utcnow().date() - campaign.start_date).days)
+        weeks_active = max(1, days_active / 7)
+        velocity = round(n_completed / weeks_active, 1)
+    else:
+        velocity = 0.0
+
+    # Weekly timeline
+    if weekly_timeline is None:
+        weekly_timeline = _build_weekly_timeline(df.loc[completed_mask, "c"])
+
+    # Channel coverage: OR together one bit per channel, then decode
+    mask = int(np.bitwise_or.reduce(_CHANNEL_BIT[codes]))
+    active_channels = [
+        name for i, name in enumerate(_CHANNEL_NAMES) if mask >> i & 1
+    ]
+
+    return CampaignMetrics(
+        campaign_id=campaign.id,
+        campaign_name=campaign.name,
+        summary=MetricsSummary(
+            total_actions=n_actions,
+            completed=n_completed,
+            verified=n_verified,
+            overdue=int(df["overdue"].sum()),
+            completion_rate=(
+                round(n_completed / n_actions * 100, 1) if n_actions else 0.0
+            ),
+            verification_rate=(
+                round(n_verified / n_completed * 100, 1) if n_completed else 0.0
+            ),
+        ),
+        activity_counts=ActivityCounts(
+            emails_sent=completed_type_counts.get(ActionType.EMAIL, 0),
+            calls_made=completed_type_counts.get(ActionType.PHONE_CALL, 0),
+            comments_filed=completed_type_counts.get(ActionType.PUBLIC_COMMENT, 0),
+            reviews_posted=completed_type_counts.get(ActionType.REVIEW, 0),
+            foia_filed=completed_type_counts.get(ActionType.FOIA_REQUEST, 0),
+            testimonies_given=completed_type_counts.get(ActionType.TESTIMONY, 0),
+            social_posts=completed_type_counts.get(ActionType.SOCIAL_POST, 0),
+        ),
+        impact=ImpactScore(
+            total_impact_score=round(total_impact, 1),
+            impact_per_action=(
+                round(total_impact / n_completed, 2) if n_completed else 0
+            ),
+            velocity_per_week=velocity,
+        ),
+        channels=ChannelCoverage(
+            active=active_channels,
+            total_possible=len(_CHANNEL_NAMES),
+            coverage_pct=round(mask.bit_count() / len(_CHANNEL_NAMES) * 100, 1),
+        ),
+        type_breakdown={
+            atype: TypeStats(
+                total=total,
+                completed=completed_type_counts.get(atype, 0),
+                completion_rate=round(
+                    completed_type_counts.get(atype, 0) / total * 100, 1
+                ),
+            )
+            for atype, total in type_counts.items()
+        },
+        weekly_timeline=weekly_timeline,
+    )
+
+
+def _build_weekly_timeline(completed_at: pd.Series) -> list[WeekCount]:
+    """Build a weekly breakdown from completion timestamps."""
+    stamps = pd.to_datetime(completed_at.dropna())
+    if stamps.empty:
+        return []
+
+    # Bin on the Monday that starts each week
+    mondays = stamps.dt.normalize() - pd.to_timedelta(stamps.dt.weekday, unit="D")
+    weekly = mondays.dt.strftime("%Y-%m-%d").value_counts().sort_index()
+
+    return [WeekCount(week=week, actions_completed=int(count)) for week, count in weekly.items()]
+
+
+def _query_weekly_timeline(db: Session, campaign_id: int) -> list[WeekCount]:
+    """Build the weekly breakdown with a GROUP BY on the week start."""
+    week = WeekStart(Action.completed_at).label("week")
+    stmt = (
+        select(week, func.count())
+        .where(
+            Action.campaign_id == campaign_id,
+            Action.status.in_((ActionStatus.COMPLETED, ActionStatus.VERIFIED)),
+            Action.completed_at.is_not(None),
         )
+        .group_by(week)
+        .order_by(week)
+    )
+    return [
+        WeekCount(week=wk.isoformat(), actions_completed=count)
+        for wk, count in db.execute(stmt)
+    ]
+
+
+def compare_campaigns(campaigns_with_actions: list[tuple]) -> list[CampaignMetrics]:
+    """
+    Compare metrics across multiple campaigns.
+
+    Args:
+        campaigns_with_actions: List of (Campaign, List[Action]) tuples
+
+    Returns:
+        One metrics result per campaign, sorted by impact score
+    """
+    results = [
+        compute_campaign_metrics(campaign, actions)
+        for campaign, actions in campaigns_with_actions
+    ]
+    results.sort(key=lambda m: m.impact.total_impact_score, reverse=True)
+    return results
+
+
+def compare_campaigns_in_db(
+    db: Session, campaign_ids: Iterable[int]
+) -> list[CampaignMetrics]:
+    """
+    Compare campaigns loaded from the database, sorted by impact score.
+
+    All campaigns' actions come back in one query and are split with a
+    single groupby, instead of one action scan per campaign.
+    """
+    ids = list(campaign_ids)
+    campaigns = db.scalars(
+        select(Campaign).where(Campaign.id.in_(ids)).order_by(Campaign.id)
+    ).all()
+    rows = db.execute(
+        select(Action.campaign_id, *_metric_columns()).where(Action.campaign_id.in_(ids))
+    )
+    df = _actions_frame(rows, with_campaign=True)
+    groups = dict(tuple(df.groupby("campaign_id", sort=False)))
+    no_actions = df.iloc[0:0]
+
+    results = [
+        _metrics_from_frame(campaign, groups.get(campaign.id, no_actions))
+        for campaign in campaigns
+    ]
+    results.sort(key=lambda m: m.impact.total_impact_score, reverse=True)
+    return results
+
+
+# --- Media and response scoring ---
+
+
+def get_media_coverage_score(mentions: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Score media coverage impact from a list of mention records.
+
+    Args:
+        mentions: List of dicts with keys:
+            - outlet: str (name of media outlet)
+            - tier: int (1=national, 2=regional, 3=local, 4=trade, 5=blog)
+            - date: str (ISO date)
+            - url: str
+            - sentiment: str ("positive", "neutral", "negative")
+
+    Returns:
+        Media impact summary
+    """
+    tier_weights = {1: 10.0, 2: 5.0, 3: 3.0, 4: 4.0, 5: 1.0}
+    sentiment_multipliers = {"positive": 1.5, "neutral": 1.0, "negative": 0.3}
+
+    total_score = 0.0
+    tier_counts = Counter()
+
+    for mention in mentions:
+        tier = mention.get("tier", 5)
+        sentiment = mention.get("sentiment", "neutral")
+        weight = tier_weights.get(tier, 1.0)
+        multiplier = sentiment_multipliers.get(sentiment, 1.0)
+        total_score += weight * multiplier
+        tier_counts[tier] += 1
+
+    return {
+        "total_mentions": len(mentions),
+        "media_impact_score": round(total_score, 1),
+        "by_tier": {
+            "national": tier_counts.get(1, 0),
+            "regional": tier_counts.get(2, 0),
+            "local": tier_counts.get(3, 0),
+            "trade": tier_counts.get(4, 0),
+            "blog": tier_counts.get(5, 0),
+        },
+    }
+
 
-        # Velocity (actions per week since campaign start)
-        if campaign.start_date and completed:
-            days_active = max(1, (datetime.utcnow().date() - campaign.start_date).days)
-            weeks_active = max(1, days_active / 7)
-            velocity = round(len(completed) / weeks_active, 1)
+def track_corporate_response(responses: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Track and score corporate responses to campaign pressure.
+
+    Args:
+        responses: List of dicts with keys:
+            - date: str
+            - type: str ("no_response", "form_letter", "meeting_offer",
+                         "partial_commitment", "full_commitment",
+                         "public_statement", "policy_change")
+            - details: str
+
+    Returns:
+        Response analysis summary
+    """
+    response_scores = {
+        "no_response": 0,
+        "form_letter": 1,
+        "meeting_offer": 3,
+        "partial_commitment": 5,
+        "public_statement": 4,
+        "full_commitment": 8,
+        "policy_change": 10,
+    }
+
+    if not responses:
+        return {"total_responses": 0, "engagement_score": 0, "trajectory": "none"}
+
+    scores = [
+        response_scores.get(r.get("type", "no_response"), 0) for r in responses
+    ]
+
+    # Trajectory: are responses improving over time?
+    if len(scores) >= 2:
+        if scores[-1] > scores[0]:
+            trajectory = "improving"
+        elif scores[-1] < scores[0]:
+            trajectory = "degrading"
         else:
-            velocity = 0.0
+            trajectory = "flat"
+    else:
+        trajectory = "insufficient_data"
+
+    return {
+        "total_responses": len(responses),
+        "engagement_score": round(sum(scores) / len(scores), 1),
+        "best_response": max(scores),
+        "trajectory": trajectory,
+        "latest_response_type": responses[-1].get("type", "unknown"),
+    }
 
-        # Completion rate
-        completion_rate = (
-            round(len(completed) / len(actions) * 100, 1) if actions else 0.0
-        )
 
-        # Verification rate
-        verification_rate = (
-            round(len(verified) / len(completed) * 100, 1) if completed else 0.0
-        )
+class ImpactTracker:
+    """Dict-returning facade over the module-level impact functions."""
 
-        # Type completion rates
-        type_completion_rates = {}
-        for atype in type_counts:
-            total = type_counts[atype]
-            done = completed_type_counts.get(atype, 0)
-            type_completion_rates[atype] = round(done / total * 100, 1) if total else 0.0
-
-        # Overdue tracking
-        overdue = [a for a in actions if a.is_overdue]
-
-        # Weekly timeline
-        weekly_timeline = self._build_weekly_timeline(completed)
-
-        # Channel coverage
-        active_channels = set()
-        channel_map = {
-            ActionType.EMAIL: "email",
-            ActionType.PHONE_CALL: "phone",
-            ActionType.SOCIAL_POST: "social_media",
-            ActionType.PUBLIC_COMMENT: "regulatory",
-            ActionType.FOIA_REQUEST: "legal",
-            ActionType.REVIEW: "consumer",
-            ActionType.TESTIMONY: "grassroots",
-            ActionType.SHAREHOLDER_ACTION: "shareholder",
-            ActionType.CONTENT_CREATION: "media",
-            ActionType.SEO_ARTICLE: "media",
-            ActionType.CITIZEN_SUIT: "legal",
-        }
-        for a in completed:
-            channel = channel_map.get(ActionType(a.action_type))
-            if channel:
-                active_channels.add(channel)
-
-        return {
-            "campaign_id": campaign.id,
-            "campaign_name": campaign.name,
-            "summary": {
-                "total_actions": len(actions),
-                "completed": len(completed),
-                "verified": len(verified),
-                "overdue": len(overdue),
-                "completion_rate": completion_rate,
-                "verification_rate": verification_rate,
-            },
-            "activity_counts": {
-                "emails_sent": emails_sent,
-                "calls_made": calls_made,
-                "comments_filed": comments_filed,
-                "reviews_posted": reviews_posted,
-                "foia_filed": foia_filed,
-                "testimonies_given": testimonies,
-                "social_posts": social_posts,
-            },
-            "impact": {
-                "total_impact_score": round(total_impact, 1),
-                "impact_per_action": (
-                    round(total_impact / len(completed), 2) if completed else 0
-                ),
-                "velocity_per_week": velocity,
-            },
-            "channels": {
-                "active": list(active_channels),
-                "total_possible": len(set(channel_map.values())),
-                "coverage_pct": round(
-                    len(active_channels) / len(set(channel_map.values())) * 100, 1
-                ),
-            },
-            "type_breakdown": {
-                atype: {
-                    "total": type_counts[atype],
-                    "completed": completed_type_counts.get(atype, 0),
-                    "completion_rate": type_completion_rates.get(atype, 0.0),
-                }
-                for atype in type_counts
-            },
-            "weekly_timeline": weekly_timeline,
-        }
-
-    def _build_weekly_timeline(self, completed_actions: List[Action]) -> List[Dict]:
-        """Build a weekly breakdown of completed actions."""
-        if not completed_actions:
-            return []
-
-        weekly = defaultdict(int)
-        for a in completed_actions:
-            if a.completed_at:
-                week_start = a.completed_at.date() - timedelta(
-                    days=a.completed_at.weekday()
-                )
-                weekly[week_start.isoformat()] += 1
-
-        return [
-            {"week": week, "actions_completed": count}
-            for week, count in sorted(weekly.items())
-        ]
+    ACTION_IMPACT_WEIGHTS = ACTION_IMPACT_WEIGHTS
+    ACTION_CHANNELS = ACTION_CHANNELS
+
+    def compute_campaign_metrics(
+        self,
+        campaign: Campaign,
+        actions: Iterable[Any],
+        db: Session | None = None,
+    ) -> dict[str, Any]:
+        """Compute impact metrics for a campaign as nested dicts."""
+        return compute_campaign_metrics(campaign, actions, db=db).to_dict()
 
     def compare_campaigns(
         self, campaigns_with_actions: List[tuple]
     ) -> List[Dict[str, Any]]:
-        """
-        Compare metrics across multiple campaigns.
-
-        Args:
-            campaigns_with_actions: List of (Campaign, List[Action]) tuples
-
-        Returns:
-            List of metric dicts, one per campaign, sorted by impact score
-        """
-        results = []
-        for campaign, actions in campaigns_with_actions:
-            metrics = self.compute_campaign_metrics(campaign, actions)
-            results.append(metrics)
-
-        results.sort(
-            key=lambda m: m["impact"]["total_impact_score"], reverse=True
-        )
-        return results
+        """Compare campaigns, sorted by impact score, as nested dicts."""
+        return [m.to_dict() for m in compare_campaigns(campaigns_with_actions)]
+
+    def compare_campaigns_in_db(
+        self, db: Session, campaign_ids: Iterable[int]
+    ) -> list[dict[str, Any]]:
+        """Compare stored campaigns with a single action query, as nested dicts."""
+        return [m.to_dict() for m in compare_campaigns_in_db(db, campaign_ids)]
 
     def get_media_coverage_score(
         self, mentions: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
-        """
-        Score media coverage impact from a list of mention records.
-
-        Args:
-            mentions: List of dicts with keys:
-                - outlet: str (name of media outlet)
-                - tier: int (1=national, 2=regional, 3=local, 4=trade, 5=blog)
-                - date: str (ISO date)
-                - url: str
-                - sentiment: str ("positive", "neutral", "negative")
-
-        Returns:
-            Media impact summary
-        """
-        tier_weights = {1: 10.0, 2: 5.0, 3: 3.0, 4: 4.0, 5: 1.0}
-        sentiment_multipliers = {"positive": 1.5, "neutral": 1.0, "negative": 0.3}
-
-        total_score = 0.0
-        tier_counts = Counter()
-
-        for mention in mentions:
-            tier = mention.get("tier", 5)
-            sentiment = mention.get("sentiment", "neutral")
-            weight = tier_weights.get(tier, 1.0)
-            multiplier = sentiment_multipliers.get(sentiment, 1.0)
-            total_score += weight * multiplier
-            tier_counts[tier] += 1
-
-        return {
-            "total_mentions": len(mentions),
-            "media_impact_score": round(total_score, 1),
-            "by_tier": {
-                "national": tier_counts.get(1, 0),
-                "regional": tier_counts.get(2, 0),
-                "local": tier_counts.get(3, 0),
-                "trade": tier_counts.get(4, 0),
-                "blog": tier_counts.get(5, 0),
-            },
-        }
+        return get_media_coverage_score(mentions)
 
     def track_corporate_response(
         self, responses: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
-        """
-        Track and score corporate responses to campaign pressure.
-
-        Args:
-            responses: List of dicts with keys:
-                - date: str
-                - type: str ("no_response", "form_letter", "meeting_offer",
-                             "partial_commitment", "full_commitment",
-                             "public_statement", "policy_change")
-                - details: str
-
-        Returns:
-            Response analysis summary
-        """
-        response_scores = {
-            "no_response": 0,
-            "form_letter": 1,
-            "meeting_offer": 3,
-            "partial_commitment": 5,
-            "public_statement": 4,
-            "full_commitment": 8,
-            "policy_change": 10,
-        }
-
-        if not responses:
-            return {"total_responses": 0, "engagement_score": 0, "trajectory": "none"}
-
-        scores = [
-            response_scores.get(r.get("type", "no_response"), 0) for r in responses
-        ]
-
-        # Trajectory: are responses improving over time?
-        if len(scores) >= 2:
-            if scores[-1] > scores[0]:
-                trajectory = "improving"
-            elif scores[-1] < scores[0]:
-                trajectory = "degrading"
-            else:
-                trajectory = "flat"
-        else:
-            trajectory = "insufficient_data"
-
-        return {
-            "total_responses": len(responses),
-            "engagement_score": round(sum(scores) / len(scores), 1),
-            "best_response": max(scores),
-            "trajectory": trajectory,
-            "latest_response_type": responses[-1].get("type", "unknown"),
-        }
+        return track_corporate_response(responses)
+
+
+# --- Queries ---
+
+
+def _metric_columns() -> list:
+    """The Action columns the metrics read, with overdue evaluated in SQL."""
+    done = (ActionStatus.COMPLETED, ActionStatus.VERIFIED)
+    is_overdue = and_(
+        Action.deadline.is_not(None),
+        Action.status.notin_(done),
+        Action.deadline < UtcNow(),
+    )
+    return [
+        Action.action_type,
+        Action.status,
+        Action.completed_at,
+        is_overdue.label("is_overdue"),
+    ]
+
+
+def action_metric_rows(campaign_id: int, yield_per: int = 1000) -> Select:
+    """Select just the columns compute_campaign_metrics reads, streamed in batches."""
+    return (
+        select(*_metric_columns())
+        .where(Action.campaign_id == campaign_id)
+        .execution_options(yield_per=yield_per)
+    )
+
+
+class WeekStart(FunctionElement):
+    """Date of the Monday starting the week of a timestamp expression."""
+
+    name = "week_start"
+    type = Date()
+    inherit_cache = True
+
+
+@compiles(WeekStart)
+def _week_start_default(element, compiler, **kw):
+    timestamp = compiler.process(element.clauses, **kw)
+    return f"CAST(date_trunc('week', {timestamp}) AS DATE)"
+
+
+@compiles(WeekStart, "sqlite")
+def _week_start_sqlite(element, compiler, **kw):
+    # Forward to the week's Sunday (same day if already Sunday), back six days
+    timestamp = compiler.process(element.clauses, **kw)
+    return f"date({timestamp}, 'weekday 0', '-6 days')"
+
+
+# Dense lookup tables indexed by ActionType ordinal (enumeration order)
+_TYPE_TO_IDX: dict[str, int] = {t.value: i for i, t in enumerate(ActionType)}
+_WEIGHTS_ARR = np.array(
+    [ACTION_IMPACT_WEIGHTS.get(t, 1.0) for t in ActionType],
+    dtype=np.float64,
+)
+_CHANNEL_NAMES: list[str] = sorted(set(ACTION_CHANNELS.values()))
+_CHANNEL_BIT = np.array(
+    [
+        1 << _CHANNEL_NAMES.index(ACTION_CHANNELS[t]) if t in ACTION_CHANNELS else 0
+        for t in ActionType
+    ],
+    dtype=np.uint16,
+)
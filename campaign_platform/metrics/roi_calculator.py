@@ -8,17 +8,293 @@ hour is an hour that could have saved a life. We owe it to both the volunteers
 and the animals to optimize relentlessly.
 """
 
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-from collections import Counter
+from functools import lru_cache
+from operator import attrgetter
+from collections.abc import Iterable
+from typing import Dict, List, NamedTuple, Optional, Any
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import Select, and_, func, or_, select
+from sqlalchemy.orm import Session
+
+try:
+    from numba import get_num_threads, njit, prange
+except ImportError:  # optional dependency
+    njit = None
 
 from campaign_platform.campaigns.models import (
     Campaign,
+    CampaignActionTotals,
+    CampaignROISnapshot,
     Action,
     ActionType,
     ActionStatus,
+    UtcNow,
 )
 
+# Dense ids for the array path, in enumeration order
+_ACTION_TYPES = tuple(ActionType)
+_N_TYPES = len(_ACTION_TYPES)
+_TYPE_IDS: dict[str, int] = {t.value: i for i, t in enumerate(ActionType)}
+_STATUS_IDS: dict[str, int] = {s.value: i for i, s in enumerate(ActionStatus)}
+_COMPLETED_STATUS_ID = _STATUS_IDS[ActionStatus.COMPLETED]
+_VERIFIED_STATUS_ID = _STATUS_IDS[ActionStatus.VERIFIED]
+_EXPIRED_STATUS_ID = _STATUS_IDS[ActionStatus.EXPIRED]
+_DONE_STATUSES = (ActionStatus.COMPLETED, ActionStatus.VERIFIED)
+
+_ACTION_ROW = np.dtype([
+    ("type_id", np.int32),
+    ("status_id", np.int8),
+    ("minutes", np.float64),
+    ("overdue", np.bool_),
+])
+_STATUS_TYPE_ROW = np.dtype([("status_id", np.int8), ("type_id", np.int32)])
+
+
+class CampaignROIContext(NamedTuple):
+    """
+    Per-campaign totals that ROI analysis and impact projection derive from.
+
+    Built once by ROICalculator.analyze (or by the query, totals and
+    DataFrame paths) and passed to roi_from_context and
+    project_from_context, so a request doing both reads the actions once.
+    """
+
+    campaign_id: int
+    campaign_name: str
+    n_actions: int
+    completed_count: int
+    completed_minutes: float
+    total_minutes: float
+    wasted_minutes: float
+    type_minutes: np.ndarray  # completed minutes, indexed by type id
+    type_counts: np.ndarray  # completed actions, indexed by type id
+    present: np.ndarray  # type ids with completed actions, in ranking tie order
+
+
+class _TypeEff(NamedTuple):
+    """Efficiency of one action type; becomes a type_breakdown entry."""
+
+    hours_invested: float
+    value_generated: float
+    value_per_hour: float
+
+
+_RUNNING_EFFICIENTLY = (
+    "Campaign is running efficiently. Consider scaling up "
+    "the highest-performing action types."
+)
+
+# Fetches every attribute the ROI math reads in a single C-level call
+_ROW_FIELDS = attrgetter("action_type", "status", "estimated_minutes", "is_overdue")
+_STATUS_AND_TYPE = attrgetter("status", "action_type")
+
+
+def _action_rows(actions: Iterable[Action]) -> tuple[tuple, ...]:
+    """(action_type, status, estimated_minutes, is_overdue) for each action."""
+    return tuple(map(_ROW_FIELDS, actions))
+
+
+def _actions_to_arrays(rows: Iterable[tuple]):
+    """Type ids, status ids, estimated minutes and overdue flags, one entry per action."""
+    arr = np.fromiter(
+        (
+            (_TYPE_IDS[action_type], _STATUS_IDS[status], minutes, overdue)
+            for action_type, status, minutes, overdue in rows
+        ),
+        dtype=_ACTION_ROW,
+    )
+    return arr["type_id"], arr["status_id"], arr["minutes"], arr["overdue"]
+
+
+def _reduce_numpy(
+    type_ids, status_ids, minutes, overdue, n_types, done_a, done_b, expired
+):
+    """
+    Reduce the action arrays to the totals calculate_campaign_roi needs.
+
+    Returns (completed count, completed minutes, total minutes, wasted
+    minutes, completed minutes per type, completed actions per type, first
+    index per type), where the last holds len(minutes) for types with no
+    completed actions.
+    """
+    n = len(minutes)
+    done_mask = (status_ids == done_a) | (status_ids == done_b)
+    wasted_mask = ~done_mask & ((status_ids == expired) | overdue)
+
+    done_idx = np.flatnonzero(done_mask)
+    done_types = type_ids[done_idx]
+    type_minutes = np.bincount(done_types, weights=minutes[done_idx], minlength=n_types)
+    type_counts = np.bincount(done_types, minlength=n_types)
+    first_seen = np.full(n_types, n, dtype=np.int64)
+    seen_types, pos = np.unique(done_types, return_index=True)
+    first_seen[seen_types] = done_idx[pos]
+
+    return (
+        len(done_idx),
+        minutes[done_idx].sum(),
+        minutes.sum(),
+        minutes[wasted_mask].sum(),
+        type_minutes,
+        type_counts,
+        first_seen,
+    )
+
+
+def _reduce_parallel(
+    type_ids, status_ids, minutes, overdue, n_types, done_a, done_b, expired,
+    n_threads,
+):
+    """Same contract as _reduce_numpy, as one loop split across n_threads."""
+    n = minutes.shape[0]
+    n_chunks = max(1, min(n_threads, n))
+    chunk = (n + n_chunks - 1) // n_chunks
+
+    # Each chunk accumulates into its own row; rows are merged at the end
+    counts = np.zeros(n_chunks, dtype=np.int64)
+    sums = np.zeros((n_chunks, 3))  # completed, total, wasted minutes
+    type_minutes = np.zeros((n_chunks, n_types))
+    type_counts = np.zeros((n_chunks, n_types), dtype=np.int64)
+    first_seen = np.full((n_chunks, n_types), n, dtype=np.int64)
+
+    for c in prange(n_chunks):
+        for i in range(c * chunk, min(n, (c + 1) * chunk)):
+            m = minutes[i]
+            sums[c, 1] += m
+            status = status_ids[i]
+            if status == done_a or status == done_b:
+                t = type_ids[i]
+                counts[c] += 1
+                sums[c, 0] += m
+                type_minutes[c, t] += m
+                type_counts[c, t] += 1
+                if first_seen[c, t] == n:
+                    first_seen[c, t] = i
+            elif status == expired or overdue[i]:
+                sums[c, 2] += m
+
+    totals = sums.sum(axis=0)
+    first = np.full(n_types, n, dtype=np.int64)
+    for c in range(n_chunks):
+        first = np.minimum(first, first_seen[c])
+    return (
+        counts.sum(),
+        totals[0],
+        totals[1],
+        totals[2],
+        type_minutes.sum(axis=0),
+        type_counts.sum(axis=0),
+        first,
+    )
+
+
+# Numba is optional (`pip install campaign-platform[fast]`); without it the
+# reduction runs as NumPy array operations. Both sum whole minutes and
+# counts, so the result doesn't depend on summation order.
+if njit is not None:
+    _reduce_jit = njit(cache=True, parallel=True)(_reduce_parallel)
+
+    def _reduce(*args):
+        # Read outside the kernel: a jitted get_num_threads() defeats caching
+        return _reduce_jit(*args, get_num_threads())
+else:
+    _reduce = _reduce_numpy
+
+
+def _context_from_rows(
+    campaign_id: int, campaign_name: str, rows: tuple[tuple, ...]
+) -> CampaignROIContext:
+    """Reduce (action_type, status, estimated_minutes, is_overdue) rows to a context."""
+    type_ids, status_ids, minutes, overdue = _actions_to_arrays(rows)
+    n_actions = len(minutes)
+
+    (
+        completed_count,
+        done_minutes,
+        total_minutes,
+        wasted_minutes,
+        type_minutes,
+        type_counts,
+        first_seen,
+    ) = _reduce(
+        type_ids, status_ids, minutes, overdue, _N_TYPES,
+        _COMPLETED_STATUS_ID, _VERIFIED_STATUS_ID, _EXPIRED_STATUS_ID,
+    )
+
+    # Types in the order they first appear among completed actions
+    n_present = int(np.count_nonzero(first_seen < n_actions))
+    present = np.argsort(first_seen, kind="stable")[:n_present]
+
+    return CampaignROIContext(
+        campaign_id=campaign_id,
+        campaign_name=campaign_name,
+        n_actions=n_actions,
+        completed_count=int(completed_count),
+        completed_minutes=float(done_minutes),
+        total_minutes=float(total_minutes),
+        wasted_minutes=float(wasted_minutes),
+        type_minutes=type_minutes,
+        type_counts=type_counts,
+        present=present,
+    )
+
+
+def _is_overdue():
+    """Action.is_overdue evaluated in SQL against the database clock."""
+    return and_(
+        Action.deadline.is_not(None),
+        Action.status.notin_(_DONE_STATUSES),
+        Action.deadline < UtcNow(),
+    )
+
+
+def action_roi_rows(campaign_id: int) -> Select:
+    """Select the columns calculate_campaign_roi reads, with overdue evaluated in SQL."""
+    return select(
+        Action.action_type,
+        Action.status,
+        Action.estimated_minutes,
+        _is_overdue().label("is_overdue"),
+    ).where(Action.campaign_id == campaign_id)
+
+
+def action_wasted_minutes(campaign_id: int) -> Select:
+    """Total estimated minutes of a campaign's expired and overdue actions."""
+    return select(func.coalesce(func.sum(Action.estimated_minutes), 0)).where(
+        Action.campaign_id == campaign_id,
+        or_(Action.status == ActionStatus.EXPIRED, _is_overdue()),
+    )
+
+
+_CONTEXT_CACHE_SIZE = 128
+_contexts: OrderedDict[tuple, CampaignROIContext] = OrderedDict()
+_contexts_lock = threading.Lock()
+
+
+def _cached_context(
+    campaign_id: int, campaign_name: str, rows: tuple[tuple, ...]
+) -> CampaignROIContext:
+    """_context_from_rows, remembered for the last few campaigns' action rows."""
+    # A hash of the rows stands in for them in the key: any write to an
+    # action's type, status or estimate (or a deadline passing) changes it,
+    # while the cache only holds each campaign's per-type totals
+    key = (campaign_id, campaign_name, len(rows), hash(rows))
+    with _contexts_lock:
+        context = _contexts.get(key)
+        if context is not None:
+            _contexts.move_to_end(key)
+            return context
+    context = _context_from_rows(campaign_id, campaign_name, rows)
+    with _contexts_lock:
+        _contexts[key] = context
+        if len(_contexts) > _CONTEXT_CACHE_SIZE:
+            _contexts.popitem(last=False)
+    return context
+
 
 class ROICalculator:
     """Calculate return on investment for campaign activities."""
@@ -75,39 +351,175 @@ class ROICalculator:
         Returns:
             ROI analysis with efficiency metrics
         """
-        completed = [
-            a for a in actions
-            if a.status in (ActionStatus.COMPLETED, ActionStatus.VERIFIED)
-        ]
+        return self._roi_for_rows(campaign, _action_rows(actions), outcomes)
+
+    def analyze(self, campaign: Campaign, actions: list[Action]) -> CampaignROIContext:
+        """
+        Reduce a campaign's actions to the totals ROI and projections need.
+
+        For callers that want both calculate_campaign_roi and project_impact
+        on the same actions: pass the result to roi_from_context and
+        project_from_context instead, and the actions are only read once.
+        """
+        return _context_from_rows(campaign.id, campaign.name, _action_rows(actions))
+
+    def from_query(
+        self,
+        session: Session,
+        campaign: Campaign,
+        outcomes: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Calculate ROI for a campaign straight from the database.
+
+        Reads only the four columns the calculation needs as plain tuples,
+        so no Action objects are loaded. Same result as calculate_campaign_roi.
+        """
+        rows = tuple(map(tuple, session.execute(action_roi_rows(campaign.id))))
+        return self._roi_for_rows(campaign, rows, outcomes)
+
+    def calculate_campaign_roi_df(
+        self,
+        campaign: Campaign,
+        df: pd.DataFrame,
+        outcomes: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Calculate ROI for a campaign whose actions are already a DataFrame.
+
+        Expects one row per action with the columns action_type, status,
+        estimated_minutes and is_overdue (as selected by action_roi_rows).
+        action_type and status hold the enum members or their values; build
+        them as object columns, since pandas' string dtype would store the
+        members' names instead. The per-type totals are one groupby over the
+        completed rows. Same result as calculate_campaign_roi.
+        """
+        status = df["status"]
+        done = status.isin(_DONE_STATUSES).to_numpy()
+        wasted = ~done & (
+            (status == ActionStatus.EXPIRED).to_numpy()
+            | df["is_overdue"].to_numpy(dtype=bool)
+        )
+        minutes = df["estimated_minutes"].to_numpy(dtype=np.float64)
 
-        # Total volunteer hours invested
-        total_hours = sum(
-            a.estimated_minutes / 60.0 for a in completed
+        # sort=False keeps the groups in the order types first complete
+        per_type = (
+            df.loc[done, "estimated_minutes"]
+            .groupby(df.loc[done, "action_type"].map(_TYPE_IDS), sort=False)
+            .agg(["sum", "size"])
         )
+        present = per_type.index.to_numpy(dtype=np.intp)
+        type_minutes = np.zeros(_N_TYPES)
+        type_minutes[present] = per_type["sum"].to_numpy(dtype=np.float64)
+        type_counts = np.zeros(_N_TYPES, dtype=np.int64)
+        type_counts[present] = per_type["size"].to_numpy()
+
+        context = CampaignROIContext(
+            campaign_id=campaign.id,
+            campaign_name=campaign.name,
+            n_actions=len(df),
+            completed_count=int(done.sum()),
+            completed_minutes=float(minutes[done].sum()),
+            total_minutes=float(minutes.sum()),
+            wasted_minutes=float(minutes[wasted].sum()),
+            type_minutes=type_minutes,
+            type_counts=type_counts,
+            present=present,
+        )
+        return self.roi_from_context(context, outcomes)
 
-        # Value of completed actions
-        action_value = 0.0
-        action_type_map = {
-            ActionType.EMAIL: "email_to_target",
-            ActionType.PHONE_CALL: "phone_call_logged",
-            ActionType.PUBLIC_COMMENT: "public_comment_filed",
-            ActionType.FOIA_REQUEST: "foia_request_filed",
-            ActionType.REVIEW: "review_posted",
-            ActionType.TESTIMONY: "testimony_given",
-            ActionType.SHAREHOLDER_ACTION: "shareholder_action",
-            ActionType.SOCIAL_POST: "social_post_engagement",
-        }
+    def from_totals(
+        self,
+        session: Session,
+        campaign: Campaign,
+        outcomes: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Calculate ROI for a campaign from its running per-type totals.
 
-        type_values = Counter()
-        for a in completed:
-            outcome_key = action_type_map.get(ActionType(a.action_type))
-            if outcome_key:
-                val = self.OUTCOME_VALUES.get(outcome_key, 5.0)
-                action_value += val
-                type_values[a.action_type] += val
-            else:
-                action_value += 5.0  # minimum value for any completed action
-                type_values[a.action_type] += 5.0
+        Hours and values come from campaign_action_totals, which the Action
+        listeners keep current, so only the overdue part of wasted hours
+        (it moves with the clock) needs an aggregate over the actions. Equal
+        to calculate_campaign_roi, except that types with equal value per
+        hour are ranked in ActionType order.
+        """
+        totals = session.execute(
+            select(
+                CampaignActionTotals.action_type,
+                CampaignActionTotals.action_count,
+                CampaignActionTotals.total_minutes,
+                CampaignActionTotals.completed_count,
+                CampaignActionTotals.completed_minutes,
+            ).where(CampaignActionTotals.campaign_id == campaign.id)
+        ).all()
+        counts = np.zeros((4, _N_TYPES))
+        for action_type, *row in totals:
+            counts[:, _TYPE_IDS[action_type]] = row
+        action_counts, total_minutes, completed_counts, completed_minutes = counts
+
+        context = CampaignROIContext(
+            campaign_id=campaign.id,
+            campaign_name=campaign.name,
+            n_actions=int(action_counts.sum()),
+            completed_count=int(completed_counts.sum()),
+            completed_minutes=float(completed_minutes.sum()),
+            total_minutes=float(total_minutes.sum()),
+            wasted_minutes=float(session.scalar(action_wasted_minutes(campaign.id))),
+            type_minutes=completed_minutes,
+            type_counts=completed_counts,
+            present=np.flatnonzero(completed_counts),
+        )
+        return self.roi_from_context(context, outcomes)
+
+    def refresh_snapshot(self, session: Session, campaign: Campaign) -> dict[str, Any]:
+        """
+        Recompute a campaign's ROI and upsert it into the snapshot table.
+
+        The caller owns the transaction and commits it.
+        """
+        roi = self.from_totals(session, campaign)
+        session.merge(
+            CampaignROISnapshot(
+                campaign_id=campaign.id,
+                roi=roi,
+                total_volunteer_hours=roi["investment"]["total_volunteer_hours"],
+                roi_pct=roi["efficiency"]["roi_pct"],
+                computed_at=datetime.utcnow(),
+            )
+        )
+        return roi
+
+    def _roi_for_rows(
+        self,
+        campaign: Campaign,
+        rows: tuple[tuple, ...],
+        outcomes: list[dict[str, Any]] | None,
+    ) -> dict[str, Any]:
+        context = _cached_context(campaign.id, campaign.name, rows)
+        return self.roi_from_context(context, outcomes)
+
+    def roi_from_context(
+        self,
+        context: CampaignROIContext,
+        outcomes: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Calculate ROI from a context built by analyze().
+
+        Same result as calculate_campaign_roi on the analyzed actions, but
+        uncached: the context is already the reduced form of the actions.
+        """
+        n_actions = context.n_actions
+        completed_count = context.completed_count
+        present = context.present
+
+        # Minutes are whole numbers, so summing them before converting to
+        # hours keeps the totals exact
+        total_hours = context.completed_minutes / 60.0
+        total_possible_hours = context.total_minutes / 60.0
+        wasted_hours = context.wasted_minutes / 60.0
+        all_type_values = context.type_counts * _VALUE_ARR
+        action_value = float(all_type_values.sum())
 
         # Add explicit outcome values
         outcome_value = 0.0
@@ -132,52 +544,39 @@ class ROICalculator:
         # Value per hour
         value_per_hour = round(total_value / max(total_hours, 0.1), 2)
 
-        # Efficiency by action type
-        type_efficiency = {}
-        type_hours = Counter()
-        for a in completed:
-            type_hours[a.action_type] += a.estimated_minutes / 60.0
-
-        for atype in type_values:
-            hours = type_hours.get(atype, 0.1)
-            type_efficiency[atype] = {
-                "hours_invested": round(hours, 1),
-                "value_generated": round(type_values[atype], 2),
-                "value_per_hour": round(type_values[atype] / max(hours, 0.1), 2),
-            }
-
-        # Sort by efficiency
-        ranked_types = sorted(
-            type_efficiency.items(),
-            key=lambda x: x[1]["value_per_hour"],
-            reverse=True,
-        )
+        # Efficiency by action type, ranked on the rounded rate. The stable
+        # sort keeps first-seen order among types with equal rates.
+        type_hours = context.type_minutes[present] / 60.0
+        type_values = all_type_values[present]
+        rates = [
+            round(r, 2) for r in (type_values / np.maximum(type_hours, 0.1)).tolist()
+        ]
+        order = np.argsort(-np.array(rates), kind="stable").tolist()
+        type_hours = type_hours.tolist()
+        # Every action is worth whole dollars, so the values need no rounding
+        type_values = type_values.tolist()
+        ranked_types = [
+            (
+                _ACTION_TYPES[present[j]],
+                _TypeEff(round(type_hours[j], 1), type_values[j], rates[j]),
+            )
+            for j in order
+        ]
 
         # Time allocation analysis
-        total_possible_hours = sum(
-            a.estimated_minutes / 60.0 for a in actions
-        )
         time_utilization = (
             round(total_hours / total_possible_hours * 100, 1)
             if total_possible_hours > 0
             else 0.0
         )
 
-        # Wasted time (overdue + expired unclaimed)
-        wasted_actions = [
-            a for a in actions
-            if a.status == ActionStatus.EXPIRED
-            or (a.is_overdue and a.status not in (ActionStatus.COMPLETED, ActionStatus.VERIFIED))
-        ]
-        wasted_hours = sum(a.estimated_minutes / 60.0 for a in wasted_actions)
-
         return {
-            "campaign_id": campaign.id,
-            "campaign_name": campaign.name,
+            "campaign_id": context.campaign_id,
+            "campaign_name": context.campaign_name,
             "investment": {
                 "total_volunteer_hours": round(total_hours, 1),
-                "total_actions_completed": len(completed),
-                "total_actions_available": len(actions),
+                "total_actions_completed": completed_count,
+                "total_actions_available": n_actions,
                 "time_utilization_pct": time_utilization,
                 "wasted_hours": round(wasted_hours, 1),
                 "cost_equivalent": round(total_cost, 2),
@@ -198,45 +597,43 @@ class ROICalculator:
                 ),
             },
             "type_breakdown": {
-                atype: data for atype, data in ranked_types
+                atype: data._asdict() for atype, data in ranked_types
             },
             "recommendations": self._generate_recommendations(
-                type_efficiency, total_hours, len(completed), len(actions)
+                ranked_types, total_hours, completed_count, n_actions
             ),
         }
 
     def _generate_recommendations(
         self,
-        type_efficiency: Dict,
+        ranked_types: list[tuple[str, _TypeEff]],
         total_hours: float,
         completed_count: int,
         total_count: int,
     ) -> List[str]:
         """Generate actionable recommendations from ROI data."""
+        # A campaign with no actions can't trip any of the checks below
+        if total_count == 0:
+            return [_RUNNING_EFFICIENTLY]
+
         recs = []
 
-        if total_count > 0 and completed_count / total_count < 0.3:
+        if completed_count / total_count < 0.3:
             recs.append(
                 "Low completion rate. Consider reducing action count and "
                 "increasing urgency signals (deadlines, progress bars)."
             )
 
-        if type_efficiency:
-            # Find highest and lowest efficiency types
-            sorted_types = sorted(
-                type_efficiency.items(),
-                key=lambda x: x[1]["value_per_hour"],
-                reverse=True,
-            )
-            if len(sorted_types) >= 2:
-                best = sorted_types[0]
-                worst = sorted_types[-1]
-                if best[1]["value_per_hour"] > worst[1]["value_per_hour"] * 3:
-                    recs.append(
-                        f"Shift volunteer hours from {worst[0]} "
-                        f"(${worst[1]['value_per_hour']}/hr) toward {best[0]} "
-                        f"(${best[1]['value_per_hour']}/hr) for 3x+ efficiency gain."
-                    )
+        # Highest and lowest efficiency types (ranked_types is sorted best first)
+        if len(ranked_types) >= 2:
+            best = ranked_types[0]
+            worst = ranked_types[-1]
+            if best[1].value_per_hour > worst[1].value_per_hour * 3:
+                recs.append(
+                    f"Shift volunteer hours from {worst[0]} "
+                    f"(${worst[1].value_per_hour}/hr) toward {best[0]} "
+                    f"(${best[1].value_per_hour}/hr) for 3x+ efficiency gain."
+                )
 
         if total_hours > 0 and completed_count / max(total_hours, 1) < 1:
             recs.append(
@@ -245,10 +642,7 @@ class ROICalculator:
             )
 
         if not recs:
-            recs.append(
-                "Campaign is running efficiently. Consider scaling up "
-                "the highest-performing action types."
-            )
+            recs.append(_RUNNING_EFFICIENTLY)
 
         return recs
 
@@ -271,46 +665,56 @@ class ROICalculator:
         Returns:
             Projected impact if hours are invested
         """
-        completed = [
-            a for a in actions
-            if a.status in (ActionStatus.COMPLETED, ActionStatus.VERIFIED)
-        ]
+        pairs = np.fromiter(
+            (
+                (_STATUS_IDS[status], _TYPE_IDS[action_type])
+                for status, action_type in map(_STATUS_AND_TYPE, actions)
+            ),
+            dtype=_STATUS_TYPE_ROW,
+        )
+        status_ids = pairs["status_id"]
+        done_mask = (status_ids == _COMPLETED_STATUS_ID) | (status_ids == _VERIFIED_STATUS_ID)
+        completed_type_ids = pairs["type_id"][done_mask]
+        return self._project(
+            len(completed_type_ids),
+            np.bincount(completed_type_ids, minlength=_N_TYPES),
+            additional_hours,
+            focus_type,
+        )
+
+    def project_from_context(
+        self,
+        context: CampaignROIContext,
+        additional_hours: float,
+        focus_type: ActionType | None = None,
+    ) -> dict[str, Any]:
+        """
+        Project impact from a context built by analyze().
+
+        Same result as project_impact on the analyzed actions.
+        """
+        return self._project(
+            context.completed_count, context.type_counts, additional_hours, focus_type
+        )
 
+    def _project(
+        self,
+        completed_count: int,
+        type_counts: np.ndarray,
+        additional_hours: float,
+        focus_type: ActionType | None,
+    ) -> dict[str, Any]:
         if focus_type:
-            hours_per = self.ESTIMATED_HOURS.get(focus_type, 0.5)
-            projected_actions = int(additional_hours / hours_per)
-            action_type_map = {
-                ActionType.EMAIL: "email_to_target",
-                ActionType.PHONE_CALL: "phone_call_logged",
-                ActionType.PUBLIC_COMMENT: "public_comment_filed",
-                ActionType.FOIA_REQUEST: "foia_request_filed",
-                ActionType.REVIEW: "review_posted",
-                ActionType.TESTIMONY: "testimony_given",
-                ActionType.SHAREHOLDER_ACTION: "shareholder_action",
-                ActionType.SOCIAL_POST: "social_post_engagement",
-            }
-            outcome_key = action_type_map.get(focus_type, "email_to_target")
-            projected_value = projected_actions * self.OUTCOME_VALUES.get(outcome_key, 5.0)
+            projected_actions, projected_value = _project_focus(
+                focus_type.value, additional_hours
+            )
         else:
             # Distribute hours across current campaign action types
-            if completed:
-                type_distribution = Counter(a.action_type for a in completed)
-                total = sum(type_distribution.values())
-                projected_actions = 0
-                projected_value = 0.0
-                for atype, count in type_distribution.items():
-                    share = count / total
-                    type_hours = additional_hours * share
-                    hours_per = self.ESTIMATED_HOURS.get(ActionType(atype), 0.5)
-                    actions_count = int(type_hours / hours_per)
-                    projected_actions += actions_count
-                    action_type_map = {
-                        ActionType.EMAIL: "email_to_target",
-                        ActionType.PHONE_CALL: "phone_call_logged",
-                        ActionType.PUBLIC_COMMENT: "public_comment_filed",
-                    }
-                    outcome_key = action_type_map.get(ActionType(atype), "email_to_target")
-                    projected_value += actions_count * self.OUTCOME_VALUES.get(outcome_key, 5.0)
+            if completed_count:
+                shares = type_counts / completed_count
+                actions_count = (additional_hours * shares / _HOURS_ARR).astype(np.int64)
+                projected_actions = int(actions_count.sum())
+                projected_value = float((actions_count * _DISTRIBUTED_VALUE_ARR).sum())
             else:
                 projected_actions = int(additional_hours / 0.5)
                 projected_value = projected_actions * 5.0
@@ -320,5 +724,61 @@ class ROICalculator:
             "focus_type": focus_type.value if focus_type else "distributed",
             "projected_additional_actions": projected_actions,
             "projected_additional_value": round(projected_value, 2),
-            "projected_new_total_actions": len(completed) + projected_actions,
+            "projected_new_total_actions": completed_count + projected_actions,
         }
+
+
+# Outcome each completed action type counts as; unmapped types are worth the
+# $5 minimum
+_ACTION_TYPE_TO_OUTCOME_KEY: dict[ActionType, str] = {
+    ActionType.EMAIL: "email_to_target",
+    ActionType.PHONE_CALL: "phone_call_logged",
+    ActionType.PUBLIC_COMMENT: "public_comment_filed",
+    ActionType.FOIA_REQUEST: "foia_request_filed",
+    ActionType.REVIEW: "review_posted",
+    ActionType.TESTIMONY: "testimony_given",
+    ActionType.SHAREHOLDER_ACTION: "shareholder_action",
+    ActionType.SOCIAL_POST: "social_post_engagement",
+}
+# Keyed on the raw string value: ActionType is a str enum, so lookups work
+# with either the stored string or the enum member without converting
+_VALUE_BY_RAW: dict[str, float] = {
+    at.value: ROICalculator.OUTCOME_VALUES.get(k, 5.0)
+    for at, k in _ACTION_TYPE_TO_OUTCOME_KEY.items()
+}
+_HOURS_BY_RAW: dict[str, float] = {
+    at.value: h for at, h in ROICalculator.ESTIMATED_HOURS.items()
+}
+# The same two maps as dense arrays indexed by _TYPE_IDS
+_VALUE_ARR = np.array(
+    [_VALUE_BY_RAW.get(t.value, 5.0) for t in _ACTION_TYPES], dtype=np.float64
+)
+_HOURS_ARR = np.array(
+    [_HOURS_BY_RAW.get(t.value, 0.5) for t in _ACTION_TYPES], dtype=np.float64
+)
+# The distributed projection values only these types at their outcome rate and
+# every other type at the $5 email rate, as it always has
+_DISTRIBUTED_VALUE_ARR = np.array(
+    [
+        _VALUE_BY_RAW[t.value]
+        if t in (ActionType.EMAIL, ActionType.PHONE_CALL, ActionType.PUBLIC_COMMENT)
+        else 5.0
+        for t in _ACTION_TYPES
+    ],
+    dtype=np.float64,
+)
+# (hours per action, value per action) for the focus_type projection
+_FOCUS_RATES: dict[str, tuple[float, float]] = {
+    t.value: (float(h), float(v))
+    for t, h, v in zip(_ACTION_TYPES, _HOURS_ARR, _VALUE_ARR)
+}
+
+
+@lru_cache(maxsize=1024)
+def _project_focus(focus_type_name: str, additional_hours: float) -> tuple[int, float]:
+    """Actions and value that additional_hours buy when spent on one type."""
+    # Depends on no campaign state, so dashboards sweeping the same
+    # what-if scenarios hit the cache
+    hours_per, value_per = _FOCUS_RATES.get(focus_type_name, (0.5, 5.0))
+    projected_actions = int(additional_hours / hours_per)
+    return projected_actions, projected_actions * value_per
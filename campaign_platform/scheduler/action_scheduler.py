@@ -12,6 +12,7 @@ Key principles:
 """
 
 from datetime import datetime, date, timedelta, time
+from collections.abc import Sequence
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
@@ -56,7 +57,7 @@ class ActionScheduler:
 
     def schedule_email_campaign(
         self,
-        action_ids: List[int],
+        action_ids: Sequence[int],
         window: ScheduleWindow,
         emails_per_day: int = 20,
         stagger_minutes: int = 15,
@@ -138,7 +139,7 @@ class ActionScheduler:
 
     def schedule_social_burst(
         self,
-        action_ids: List[int],
+        action_ids: Sequence[int],
         burst_time: datetime,
         pre_burst_minutes: int = 5,
         platform: str = "twitter",
@@ -194,7 +195,7 @@ class ActionScheduler:
 
     def schedule_phone_bank(
         self,
-        action_ids: List[int],
+        action_ids: Sequence[int],
         window: ScheduleWindow,
         calls_per_hour: int = 10,
         target_timezone: str = "US/Eastern",
@@ -261,7 +262,7 @@ class ActionScheduler:
         self,
         phases: List[Dict[str, Any]],
         campaign_start: date,
-        actions_per_phase: Dict[int, List[int]],
+        actions_per_phase: dict[int, Sequence[int]],
     ) -> List[ScheduledAction]:
         """
         Schedule an escalation ladder -- each phase starts when the previous
@@ -338,7 +339,7 @@ class ActionScheduler:
 
     def schedule_comment_period(
         self,
-        action_ids: List[int],
+        action_ids: Sequence[int],
         comment_deadline: datetime,
         ramp_up_days: int = 14,
     ) -> List[ScheduledAction]:
@@ -0,0 +1,456 @@
+"""
+Tests for the dashboard API and its response cache.
+"""
+
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
+from sqlalchemy.pool import StaticPool
+
+from campaign_platform.campaigns.models import (
+    Action,
+    ActionStatus,
+    Base,
+    Campaign,
+    CampaignActionTotals,
+    CampaignMetricsSnapshot,
+    CampaignROISnapshot,
+    Participant,
+    Target,
+    action_counter_values,
+)
+from campaign_platform.dashboard import api, cache
+
+# --- Fixtures ---
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio calls the cache makes."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value.encode()
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+@pytest.fixture(autouse=True)
+def no_cache(monkeypatch):
+    """Run without Redis unless a test opts in through redis_cache."""
+    monkeypatch.setattr(cache, "REDIS_URL", None)
+    monkeypatch.setattr(cache, "_client", None)
+
+
+@pytest.fixture
+def redis_cache(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(cache, "_client", client)
+    return client
+
+
+@pytest.fixture
+async def sessions():
+    """A fresh in-memory aiosqlite database per test, with its schema."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+async def client(sessions, monkeypatch):
+    """An HTTP client for the app, with requests and background tasks on sessions."""
+
+    async def get_db():
+        async with sessions() as session:
+            yield session
+
+    # Snapshot refreshes run as background tasks with their own sessions
+    monkeypatch.setattr(api, "AsyncSessionLocal", sessions)
+    api.app.dependency_overrides[api.get_db] = get_db
+    transport = httpx.ASGITransport(app=api.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+    api.app.dependency_overrides.clear()
+
+
+@pytest.fixture
+async def campaign_id(client):
+    response = await client.post(
+        "/api/campaigns",
+        json={
+            "name": "Test Corporate Campaign",
+            "campaign_type": "corporate",
+            "target_summary": "TestCorp",
+            "goal": "Adopt a cage-free policy",
+        },
+    )
+    assert response.status_code == 200
+    return response.json()["id"]
+
+
+@pytest.fixture
+async def action_ids(client, campaign_id):
+    ids = []
+    for action_type, minutes in (("email", 15), ("phone_call", 5), ("social_post", 10)):
+        response = await client.post(
+            "/api/actions",
+            json={
+                "campaign_id": campaign_id,
+                "action_type": action_type,
+                "title": f"Test {action_type}",
+                "description": "test",
+                "estimated_minutes": minutes,
+            },
+        )
+        assert response.status_code == 200
+        ids.append(response.json()["id"])
+    return ids
+
+
+@pytest.fixture
+async def participant_id(client):
+    response = await client.post(
+        "/api/participants", json={"name": "Test Volunteer", "email": "test@example.com"}
+    )
+    assert response.status_code == 200
+    return response.json()["id"]
+
+
+async def progress(client, campaign_id) -> dict:
+    response = await client.get(f"/api/campaigns/{campaign_id}/progress")
+    assert response.status_code == 200
+    return response.json()
+
+
+async def participant(client, participant_id) -> dict:
+    response = await client.get(f"/api/participants/{participant_id}")
+    assert response.status_code == 200
+    return response.json()
+
+
+# --- Action Endpoint Tests ---
+
+
+class TestActionEndpoints:
+    async def test_claim_sets_assignee(self, client, action_ids, participant_id):
+        response = await client.post(
+            f"/api/actions/{action_ids[0]}/claim", params={"participant_id": participant_id}
+        )
+        assert response.status_code == 200
+        assert response.json() == {
+            "status": "claimed",
+            "action_id": action_ids[0],
+            "participant_id": participant_id,
+        }
+        actions = (await client.get("/api/actions", params={"status": "claimed"})).json()
+        assert [(a["id"], a["assigned_to"]) for a in actions] == [
+            (action_ids[0], participant_id)
+        ]
+
+    async def test_claim_already_claimed_conflicts(
+        self, client, campaign_id, action_ids, participant_id
+    ):
+        url = f"/api/actions/{action_ids[0]}/claim"
+        await client.post(url, params={"participant_id": participant_id})
+        before = await progress(client, campaign_id)
+        other = (
+            await client.post("/api/participants", json={"name": "B", "email": "b@example.com"})
+        ).json()["id"]
+
+        response = await client.post(url, params={"participant_id": other})
+        assert response.status_code == 409
+        assert response.json()["detail"] == "Action not available"
+        assert await progress(client, campaign_id) == before
+        actions = (await client.get("/api/actions", params={"status": "claimed"})).json()
+        assert [a["assigned_to"] for a in actions] == [participant_id]
+
+    async def test_complete_and_verify_count_once(
+        self, client, sessions, campaign_id, action_ids, participant_id
+    ):
+        action_id = action_ids[0]
+        await client.post(
+            f"/api/actions/{action_id}/claim", params={"participant_id": participant_id}
+        )
+
+        response = await client.post(f"/api/actions/{action_id}/complete")
+        assert response.json() == {"status": "completed", "action_id": action_id}
+        again = await client.post(f"/api/actions/{action_id}/complete")
+        assert again.status_code == 409
+        counts = await progress(client, campaign_id)
+        assert (counts["total_actions"], counts["completed_actions"]) == (3, 1)
+        assert counts["verified_actions"] == 0
+        assert counts["completion_pct"] == 33.3
+        volunteer = await participant(client, participant_id)
+        assert volunteer["actions_completed"] == 1
+
+        response = await client.post(f"/api/actions/{action_id}/verify")
+        assert response.json() == {"status": "verified", "action_id": action_id}
+        again = await client.post(f"/api/actions/{action_id}/verify")
+        assert again.status_code == 409
+        counts = await progress(client, campaign_id)
+        assert (counts["completed_actions"], counts["verified_actions"]) == (1, 1)
+        volunteer = await participant(client, participant_id)
+        assert (volunteer["actions_completed"], volunteer["actions_verified"]) == (1, 1)
+
+        async with sessions() as db:
+            totals = (await db.scalars(select(CampaignActionTotals))).all()
+        done = {t.action_type.value: (t.completed_count, t.completed_minutes) for t in totals}
+        assert done == {"email": (1, 15), "phone_call": (0, 0), "social_post": (0, 0)}
+
+    async def test_complete_unclaimed_action(self, client, campaign_id, action_ids):
+        response = await client.post(
+            f"/api/actions/{action_ids[1]}/complete",
+            params={"verification_url": "https://example.com/proof"},
+        )
+        assert response.status_code == 200
+        assert (await progress(client, campaign_id))["completed_actions"] == 1
+
+    async def test_verify_requires_completion(self, client, campaign_id, action_ids):
+        response = await client.post(f"/api/actions/{action_ids[0]}/verify")
+        assert response.status_code == 409
+        assert response.json()["detail"] == "Action must be completed first"
+        assert (await progress(client, campaign_id))["verified_actions"] == 0
+
+    @pytest.mark.parametrize("operation", ["claim", "complete", "verify"])
+    async def test_unknown_action_is_404(self, client, participant_id, operation):
+        response = await client.post(
+            f"/api/actions/999/{operation}", params={"participant_id": participant_id}
+        )
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Action not found"
+
+    async def test_claim_unknown_participant_is_404(self, client, action_ids):
+        response = await client.post(
+            f"/api/actions/{action_ids[0]}/claim", params={"participant_id": 999}
+        )
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Participant not found"
+
+    def test_postgresql_chains_updates_on_returning_row(self):
+        action_stmt = (
+            update(Action)
+            .where(Action.id == 1, Action.status == ActionStatus.COMPLETED)
+            .values(status=ActionStatus.VERIFIED)
+            .returning(Action.campaign_id, Action.assigned_to)
+        )
+        stmt = api._chained_update(
+            action_stmt,
+            action_counter_values(verified=1),
+            {"actions_verified": Participant.actions_verified + 1},
+        )
+        sql = " ".join(str(stmt.compile(dialect=postgresql.dialect())).split())
+        assert sql.startswith("WITH upd AS (UPDATE actions SET status=")
+        assert "RETURNING actions.campaign_id, actions.assigned_to), bump_campaign AS" in sql
+        assert "verified_actions=(campaigns.verified_actions + " in sql
+        assert "FROM upd WHERE campaigns.id = upd.campaign_id), bump_participant AS" in sql
+        assert "actions_verified=(participants.actions_verified + " in sql
+        assert "FROM upd WHERE participants.id = upd.assigned_to)" in sql
+        assert sql.endswith("SELECT upd.campaign_id, upd.assigned_to FROM upd")
+
+
+# --- Snapshot Tests ---
+
+
+class TestMetricsSnapshot:
+    async def test_snapshot_rebuilt_after_write(self, client, sessions, campaign_id, action_ids):
+        metrics = (await client.get(f"/api/metrics/{campaign_id}")).json()
+        assert (metrics["summary"]["total_actions"], metrics["summary"]["completed"]) == (3, 0)
+        async with sessions() as db:
+            assert (await db.get(CampaignMetricsSnapshot, campaign_id)).metrics == metrics
+
+        # The write drops the snapshot; its background task stores a new one
+        await client.post(f"/api/actions/{action_ids[0]}/complete")
+        async with sessions() as db:
+            snapshot = await db.get(CampaignMetricsSnapshot, campaign_id)
+        assert snapshot.metrics["summary"]["completed"] == 1
+        assert (await client.get(f"/api/metrics/{campaign_id}")).json() == snapshot.metrics
+
+    async def test_stale_snapshot_recomputed(self, client, sessions, campaign_id, action_ids):
+        await client.get(f"/api/metrics/{campaign_id}")
+        async with sessions() as db:
+            snapshot = await db.get(CampaignMetricsSnapshot, campaign_id)
+            snapshot.metrics = {"stale": True}
+            snapshot.computed_at -= api.METRICS_SNAPSHOT_MAX_AGE / 2
+            await db.commit()
+        assert (await client.get(f"/api/metrics/{campaign_id}")).json() == {"stale": True}
+
+        async with sessions() as db:
+            snapshot = await db.get(CampaignMetricsSnapshot, campaign_id)
+            snapshot.computed_at = datetime.utcnow() - api.METRICS_SNAPSHOT_MAX_AGE
+            await db.commit()
+        metrics = (await client.get(f"/api/metrics/{campaign_id}")).json()
+        assert metrics["summary"]["total_actions"] == 3
+
+    async def test_unknown_campaign_is_404(self, client):
+        response = await client.get("/api/metrics/999")
+        assert response.status_code == 404
+
+
+class TestROISnapshot:
+    async def test_snapshot_rebuilt_after_write(self, client, sessions, campaign_id, action_ids):
+        roi = (await client.get(f"/api/metrics/{campaign_id}/roi")).json()
+        assert roi["investment"]["total_actions_completed"] == 0
+        async with sessions() as db:
+            assert (await db.get(CampaignROISnapshot, campaign_id)).roi == roi
+
+        await client.post(f"/api/actions/{action_ids[0]}/complete")
+        async with sessions() as db:
+            snapshot = await db.get(CampaignROISnapshot, campaign_id)
+        assert snapshot.roi["investment"]["total_actions_completed"] == 1
+        assert snapshot.roi["returns"]["action_value"] == 5.0
+        assert (await client.get(f"/api/metrics/{campaign_id}/roi")).json() == snapshot.roi
+
+    async def test_stale_snapshot_recomputed(self, client, sessions, campaign_id, action_ids):
+        await client.get(f"/api/metrics/{campaign_id}/roi")
+        async with sessions() as db:
+            snapshot = await db.get(CampaignROISnapshot, campaign_id)
+            snapshot.roi = {"stale": True}
+            await db.commit()
+        assert (await client.get(f"/api/metrics/{campaign_id}/roi")).json() == {"stale": True}
+
+        async with sessions() as db:
+            snapshot = await db.get(CampaignROISnapshot, campaign_id)
+            snapshot.computed_at = datetime.utcnow() - api.METRICS_SNAPSHOT_MAX_AGE
+            await db.commit()
+        roi = (await client.get(f"/api/metrics/{campaign_id}/roi")).json()
+        assert roi["investment"]["total_actions_available"] == 3
+
+    async def test_unknown_campaign_is_404(self, client):
+        response = await client.get("/api/metrics/999/roi")
+        assert response.status_code == 404
+
+
+# --- List Endpoint Tests ---
+
+
+class TestListEndpoints:
+    @pytest.fixture
+    async def target_id(self, client, campaign_id):
+        response = await client.post(
+            "/api/targets",
+            json={
+                "campaign_id": campaign_id,
+                "name": "Jane Doe",
+                "target_type": "executive",
+                "organization": "TestCorp",
+                "contacts": {"email": "ceo@testcorp.example"},
+            },
+        )
+        assert response.status_code == 200
+        return response.json()["id"]
+
+    @pytest.mark.parametrize(
+        "path, model, response_model",
+        [
+            ("/api/campaigns", Campaign, api.CampaignResponse),
+            ("/api/actions", Action, api.ActionResponse),
+            ("/api/targets", Target, api.TargetResponse),
+            ("/api/participants", Participant, api.ParticipantResponse),
+        ],
+    )
+    async def test_list_matches_response_model(
+        self, client, sessions, action_ids, participant_id, target_id, path, model, response_model
+    ):
+        # The msgspec encoding must give what response_model would have
+        await client.post(f"/api/actions/{action_ids[0]}/complete")
+        response = await client.get(path)
+        assert response.status_code == 200
+
+        stmt = select(model).order_by(model.id)
+        if model is Campaign:
+            stmt = stmt.options(selectinload(Campaign.actions))
+        async with sessions() as db:
+            rows = (await db.scalars(stmt)).all()
+        expected = [response_model.model_validate(row).model_dump(mode="json") for row in rows]
+        items = sorted(response.json(), key=lambda item: item["id"])
+        assert items == expected
+        assert [list(item) for item in items] == [list(item) for item in expected]
+
+
+# --- Cache Tests ---
+
+
+class TestCache:
+    async def test_get_or_compute_without_redis_always_computes(self):
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return {"n": len(calls)}
+
+        assert await cache.get_or_compute("k", compute) == {"n": 1}
+        assert await cache.get_or_compute("k", compute) == {"n": 2}
+
+    async def test_get_or_compute_serves_cached_value(self, redis_cache):
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return {"n": len(calls)}
+
+        results = await asyncio.gather(*(cache.get_or_compute("k", compute) for _ in range(5)))
+        assert results == [{"n": 1}] * 5
+        assert await cache.get_or_compute("k", compute) == {"n": 1}
+        await cache.invalidate("k")
+        assert await cache.get_or_compute("k", compute) == {"n": 2}
+
+    async def test_get_or_compute_never_runs_one_key_concurrently(self, redis_cache):
+        # With writes failing every waiter recomputes in turn, while later
+        # requests keep arriving; all of them must queue on the same lock
+        async def failing_setex(key, ttl, value):
+            raise ConnectionError("redis down")
+
+        redis_cache.setex = failing_setex
+        active = peak = 0
+
+        async def compute():
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            for _ in range(3):
+                await asyncio.sleep(0)
+            active -= 1
+            return {"ok": True}
+
+        async def request(delay):
+            for _ in range(delay):
+                await asyncio.sleep(0)
+            return await cache.get_or_compute("k", compute)
+
+        await asyncio.gather(*(request(i) for i in range(20)))
+        assert peak == 1
+        assert not cache._locks and not cache._lock_users
+
+    async def test_campaign_details_cached_until_patch(self, client, redis_cache, campaign_id):
+        url = f"/api/campaigns/{campaign_id}"
+        first = (await client.get(url)).json()
+        assert cache.campaign_key(campaign_id) in redis_cache.data
+        assert (await client.get(url)).json() == first
+
+        response = await client.patch(url, json={"name": "Renamed"})
+        assert response.json()["name"] == "Renamed"
+        assert cache.campaign_key(campaign_id) not in redis_cache.data
+        assert (await client.get(url)).json() == {**first, "name": "Renamed"}
+
+    async def test_progress_cache_dropped_by_action_writes(
+        self, client, redis_cache, campaign_id, action_ids
+    ):
+        assert (await progress(client, campaign_id))["completed_actions"] == 0
+        assert cache.progress_key(campaign_id) in redis_cache.data
+        await client.post(f"/api/actions/{action_ids[0]}/complete")
+        assert (await progress(client, campaign_id))["completed_actions"] == 1
@@ -2,15 +2,21 @@
 Tests for the Campaign Coordination Platform.
 """
 
+import numpy as np
+import pandas as pd
 import pytest
 from datetime import date, datetime, timedelta
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import create_engine, event, inspect, select, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from campaign_platform.campaigns.models import (
     Base,
     Campaign,
+    CampaignActionTotals,
+    CampaignMetricsSnapshot,
+    CampaignROISnapshot,
     Action,
     Target,
     Participant,
@@ -19,11 +25,18 @@ from campaign_platform.campaigns.models import (
     ActionType,
     ActionStatus,
     TargetType,
-    create_tables,
+    async_database_url,
+    migrate_schema,
+    recount_action_type_totals,
 )
 from campaign_platform.campaigns.campaign_builder import CampaignBuilder
 from campaign_platform.campaigns.action_generator import ActionGenerator, ActionSpec
-from campaign_platform.metrics.impact_tracker import ImpactTracker
+from campaign_platform.metrics.impact_tracker import (
+    ImpactTracker,
+    action_metric_rows,
+    compute_campaign_metrics,
+)
+from campaign_platform.metrics import roi_calculator
 from campaign_platform.metrics.roi_calculator import ROICalculator
 from campaign_platform.scheduler.action_scheduler import ActionScheduler, ScheduleWindow
 
@@ -31,25 +44,99 @@ from campaign_platform.scheduler.action_scheduler import ActionScheduler, Schedu
 # --- Fixtures ---
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def engine():
-    """Create an in-memory SQLite database for testing."""
-    eng = create_engine("sqlite:///:memory:", echo=False)
+    """Create one in-memory SQLite database, with its schema, for the whole run."""
+    # StaticPool hands every checkout the same connection, so every test
+    # sees the one in-memory database
+    eng = create_engine(
+        "sqlite:///:memory:",
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(eng, "connect")
+    def _configure_connection(dbapi_connection, connection_record):
+        # pysqlite's own transaction handling breaks SAVEPOINT; let
+        # SQLAlchemy emit BEGIN itself
+        dbapi_connection.isolation_level = None
+        # The database dies with the process, so skip durability bookkeeping
+        for pragma in (
+            "synchronous=OFF",
+            "journal_mode=MEMORY",
+            "temp_store=MEMORY",
+            "locking_mode=EXCLUSIVE",
+        ):
+            dbapi_connection.execute(f"PRAGMA {pragma}")
+
+    @event.listens_for(eng, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(eng)
-    return eng
+    yield eng
+    eng.dispose()
 
 
-@pytest.fixture
-def db(engine) -> Session:
-    """Create a test database session."""
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
+@pytest.fixture(scope="module")
+def module_connection(engine):
+    """A connection whose outer transaction is rolled back after the module."""
+    conn = engine.connect()
+    transaction = conn.begin()
+    yield conn
+    transaction.rollback()
+    conn.close()
+
+
+@pytest.fixture(scope="module")
+def module_db(module_connection) -> Session:
+    """The session the module-scoped sample fixtures are stored through."""
+    # Commits only release a SAVEPOINT of the module's outer transaction
+    session = Session(bind=module_connection, join_transaction_mode="create_savepoint")
     yield session
     session.close()
 
 
 @pytest.fixture
-def sample_campaign(db: Session) -> Campaign:
+def db(module_connection, module_db: Session) -> Session:
+    """The test database session; everything the test writes is rolled back."""
+    # The shared fixtures only flush; keep their rows outside the SAVEPOINT
+    module_db.commit()
+    savepoint = module_connection.begin_nested()
+    shared = set(module_db)
+    yield module_db
+    module_db.rollback()
+    if savepoint.is_active:
+        savepoint.rollback()
+    # Forget the test's own rows and reload the shared fixtures as stored
+    for obj in set(module_db) - shared:
+        module_db.expunge(obj)
+    module_db.expire_all()
+
+
+@pytest.fixture(scope="session")
+def now() -> datetime:
+    """The clock, read once per run; fixtures and tests date things from it."""
+    # Deadlines built from it stay in the past, as the real clock only
+    # moves forward, and SQL overdue checks still agree with is_overdue
+    return datetime.utcnow()
+
+
+@pytest.fixture(scope="class")
+def tracker() -> ImpactTracker:
+    """One stateless ImpactTracker shared by a test class."""
+    return ImpactTracker()
+
+
+@pytest.fixture(scope="class")
+def calculator() -> ROICalculator:
+    """One stateless ROICalculator shared by a test class."""
+    return ROICalculator()
+
+
+@pytest.fixture(scope="module")
+def sample_campaign(module_db: Session) -> Campaign:
     """Create a sample corporate campaign."""
     campaign = CampaignBuilder.build_campaign(
         name="Test Corporate Campaign",
@@ -58,14 +145,13 @@ def sample_campaign(db: Session) -> Campaign:
         goal="Commit to phasing out practice X by 2027 with independent verification",
         start_date=date.today(),
     )
-    db.add(campaign)
-    db.commit()
-    db.refresh(campaign)
+    module_db.add(campaign)
+    module_db.flush()
     return campaign
 
 
-@pytest.fixture
-def sample_target(db: Session, sample_campaign: Campaign) -> Target:
+@pytest.fixture(scope="module")
+def sample_target(module_db: Session, sample_campaign: Campaign) -> Target:
     """Create a sample target."""
     target = Target(
         campaign_id=sample_campaign.id,
@@ -77,14 +163,13 @@ def sample_target(db: Session, sample_campaign: Campaign) -> Target:
         social_accounts={"twitter": "@testcorp"},
         vulnerability_score=7.5,
     )
-    db.add(target)
-    db.commit()
-    db.refresh(target)
+    module_db.add(target)
+    module_db.flush()
     return target
 
 
-@pytest.fixture
-def sample_participant(db: Session) -> Participant:
+@pytest.fixture(scope="module")
+def sample_participant(module_db: Session) -> Participant:
     """Create a sample participant."""
     participant = Participant(
         name="Jane Volunteer",
@@ -92,48 +177,44 @@ def sample_participant(db: Session) -> Participant:
         skills=["writing", "research", "social_media"],
         availability_minutes_per_week=120,
     )
-    db.add(participant)
-    db.commit()
-    db.refresh(participant)
+    module_db.add(participant)
+    module_db.flush()
     return participant
 
 
 @pytest.fixture
-def sample_actions(db: Session, sample_campaign: Campaign) -> list:
+def sample_actions(db: Session, sample_campaign: Campaign, now: datetime) -> list:
     """Create sample actions across different types and statuses."""
-    actions = [
-        Action(
-            campaign_id=sample_campaign.id,
+    # Only what differs per action; every one belongs to sample_campaign
+    fields = [
+        dict(
             action_type=ActionType.EMAIL,
             title="Email CEO about practice X",
             description="Send personalized email to CEO",
             estimated_minutes=15,
             priority=2,
             status=ActionStatus.COMPLETED,
-            completed_at=datetime.utcnow() - timedelta(days=3),
+            completed_at=now - timedelta(days=3),
         ),
-        Action(
-            campaign_id=sample_campaign.id,
+        dict(
             action_type=ActionType.PHONE_CALL,
             title="Call investor relations",
             description="Call IR about ESG concerns",
             estimated_minutes=5,
             priority=2,
             status=ActionStatus.COMPLETED,
-            completed_at=datetime.utcnow() - timedelta(days=2),
+            completed_at=now - timedelta(days=2),
         ),
-        Action(
-            campaign_id=sample_campaign.id,
+        dict(
             action_type=ActionType.SOCIAL_POST,
             title="Post about TestCorp practices",
             description="Tweet thread about findings",
             estimated_minutes=10,
             priority=3,
             status=ActionStatus.VERIFIED,
-            completed_at=datetime.utcnow() - timedelta(days=1),
+            completed_at=now - timedelta(days=1),
         ),
-        Action(
-            campaign_id=sample_campaign.id,
+        dict(
             action_type=ActionType.PUBLIC_COMMENT,
             title="Comment on EPA rule",
             description="Submit substantive comment on proposed rule",
@@ -141,8 +222,7 @@ def sample_actions(db: Session, sample_campaign: Campaign) -> list:
             priority=4,
             status=ActionStatus.AVAILABLE,
         ),
-        Action(
-            campaign_id=sample_campaign.id,
+        dict(
             action_type=ActionType.REVIEW,
             title="Post factual Google review",
             description="Review based on documented findings",
@@ -151,11 +231,9 @@ def sample_actions(db: Session, sample_campaign: Campaign) -> list:
             status=ActionStatus.AVAILABLE,
         ),
     ]
-    for a in actions:
-        db.add(a)
-    db.commit()
-    for a in actions:
-        db.refresh(a)
+    actions = [Action(campaign_id=sample_campaign.id, **f) for f in fields]
+    db.add_all(actions)
+    db.flush()
     return actions
 
 
@@ -163,59 +241,70 @@ def sample_actions(db: Session, sample_campaign: Campaign) -> list:
 
 
 class TestCampaignBuilder:
-    def test_build_corporate_campaign(self, db):
+    @pytest.mark.parametrize(
+        "campaign_type, name, target_summary, goal, expected_phases, required_channel",
+        [
+            (
+                CampaignType.CORPORATE,
+                "Smithfield Gestation Crates",
+                "Smithfield Foods",
+                "Phase out gestation crates across all facilities by 2028",
+                4,
+                None,
+            ),
+            (
+                CampaignType.LEGISLATIVE,
+                "Farm System Reform Act",
+                "US Congress",
+                "Pass the Farm System Reform Act",
+                3,
+                None,
+            ),
+            (
+                CampaignType.REGULATORY,
+                "USDA Inspection Standards",
+                "USDA FSIS",
+                "Strengthen line speed regulations",
+                None,
+                "regulatory",
+            ),
+            (
+                CampaignType.INVESTIGATION,
+                "Tyson Water Pollution",
+                "Tyson Foods facilities in Arkansas",
+                "Document Clean Water Act violations for citizen suit",
+                None,
+                None,
+            ),
+            (
+                CampaignType.CULTURAL,
+                "Factory Farm Search Results",
+                "Public narrative about factory farming",
+                "Own first page of Google for 'factory farm conditions'",
+                None,
+                "social_media",
+            ),
+        ],
+    )
+    def test_build_campaign(
+        self, campaign_type, name, target_summary, goal, expected_phases, required_channel
+    ):
         campaign = CampaignBuilder.build_campaign(
-            name="Smithfield Gestation Crates",
-            campaign_type=CampaignType.CORPORATE,
-            target_summary="Smithfield Foods",
-            goal="Phase out gestation crates across all facilities by 2028",
+            name=name,
+            campaign_type=campaign_type,
+            target_summary=target_summary,
+            goal=goal,
         )
-        assert campaign.name == "Smithfield Gestation Crates"
-        assert campaign.campaign_type == CampaignType.CORPORATE
+        assert campaign.name == name
+        assert campaign.campaign_type == campaign_type
         assert campaign.status == CampaignStatus.DRAFT
-        assert len(campaign.escalation_ladder) == 4
         assert len(campaign.channels) > 0
         assert campaign.start_date == date.today()
         assert campaign.deadline > date.today()
-
-    def test_build_legislative_campaign(self, db):
-        campaign = CampaignBuilder.build_campaign(
-            name="Farm System Reform Act",
-            campaign_type=CampaignType.LEGISLATIVE,
-            target_summary="US Congress",
-            goal="Pass the Farm System Reform Act",
-        )
-        assert campaign.campaign_type == CampaignType.LEGISLATIVE
-        assert len(campaign.escalation_ladder) == 3
-
-    def test_build_regulatory_campaign(self, db):
-        campaign = CampaignBuilder.build_campaign(
-            name="USDA Inspection Standards",
-            campaign_type=CampaignType.REGULATORY,
-            target_summary="USDA FSIS",
-            goal="Strengthen line speed regulations",
-        )
-        assert campaign.campaign_type == CampaignType.REGULATORY
-        assert "regulatory" in campaign.channels
-
-    def test_build_investigation_campaign(self, db):
-        campaign = CampaignBuilder.build_campaign(
-            name="Tyson Water Pollution",
-            campaign_type=CampaignType.INVESTIGATION,
-            target_summary="Tyson Foods facilities in Arkansas",
-            goal="Document Clean Water Act violations for citizen suit",
-        )
-        assert campaign.campaign_type == CampaignType.INVESTIGATION
-
-    def test_build_cultural_campaign(self, db):
-        campaign = CampaignBuilder.build_campaign(
-            name="Factory Farm Search Results",
-            campaign_type=CampaignType.CULTURAL,
-            target_summary="Public narrative about factory farming",
-            goal="Own first page of Google for 'factory farm conditions'",
-        )
-        assert campaign.campaign_type == CampaignType.CULTURAL
-        assert "social_media" in campaign.channels
+        if expected_phases is not None:
+            assert len(campaign.escalation_ladder) == expected_phases
+        if required_channel is not None:
+            assert required_channel in campaign.channels
 
     def test_campaign_slug_generation(self, db):
         campaign = CampaignBuilder.build_campaign(
@@ -283,36 +372,18 @@ class TestActionGenerator:
         assert ActionGenerator.get_time_tier(60) == "long"
         assert ActionGenerator.get_time_tier(120) == "long"
 
-    def test_generate_5min_actions(self, sample_campaign):
-        specs = ActionGenerator.generate_for_time(
-            campaign=sample_campaign,
-            minutes_available=5,
-        )
-        for spec in specs:
-            assert spec.estimated_minutes <= 5
-
-    def test_generate_15min_actions(self, sample_campaign):
+    @pytest.mark.parametrize(
+        "minutes, expect_any", [(5, False), (15, False), (30, False), (120, True)]
+    )
+    def test_generate_time_bounded(self, sample_campaign, minutes, expect_any):
         specs = ActionGenerator.generate_for_time(
             campaign=sample_campaign,
-            minutes_available=15,
+            minutes_available=minutes,
         )
         for spec in specs:
-            assert spec.estimated_minutes <= 15
-
-    def test_generate_30min_actions(self, sample_campaign):
-        specs = ActionGenerator.generate_for_time(
-            campaign=sample_campaign,
-            minutes_available=30,
-        )
-        for spec in specs:
-            assert spec.estimated_minutes <= 30
-
-    def test_generate_2hr_actions(self, sample_campaign):
-        specs = ActionGenerator.generate_for_time(
-            campaign=sample_campaign,
-            minutes_available=120,
-        )
-        assert len(specs) > 0
+            assert spec.estimated_minutes <= minutes
+        if expect_any:
+            assert len(specs) > 0
 
     def test_generate_with_targets(self, sample_campaign, sample_target):
         specs = ActionGenerator.generate_for_time(
@@ -321,8 +392,7 @@ class TestActionGenerator:
             targets=[sample_target],
         )
         # At least some specs should reference the target
-        target_refs = [s for s in specs if "John Smith" in s.title or "TestCorp" in s.description]
-        assert len(target_refs) > 0
+        assert any("John Smith" in s.title or "TestCorp" in s.description for s in specs)
 
     def test_generate_with_participant_skills(self, sample_campaign, sample_participant):
         specs = ActionGenerator.generate_for_time(
@@ -331,11 +401,11 @@ class TestActionGenerator:
             participant=sample_participant,
         )
         # Participant has writing, research, social_media skills
-        for spec in specs:
-            if spec.requires_skills:
-                assert any(
-                    s in sample_participant.skills for s in spec.requires_skills
-                )
+        assert all(
+            any(s in sample_participant.skills for s in spec.requires_skills)
+            for spec in specs
+            if spec.requires_skills
+        )
 
     def test_generate_action_from_spec(self, sample_campaign):
         spec = ActionSpec(
@@ -350,7 +420,7 @@ class TestActionGenerator:
         assert action.action_type == ActionType.EMAIL
         assert action.title == "Test Email"
 
-    def test_priority_calculation(self, sample_campaign, sample_target):
+    def test_priority_calculation(self, db, sample_campaign, sample_target):
         # High vulnerability target should yield lower priority number (= higher priority)
         sample_target.vulnerability_score = 9.0
         specs = ActionGenerator.generate_for_time(
@@ -378,6 +448,16 @@ class TestModels:
         # 3 of 5 actions are completed/verified
         assert sample_campaign.completion_pct == 60.0
 
+    def test_campaign_completion_pct_tracks_status_changes(
+        self, db, sample_campaign, sample_actions
+    ):
+        assert sample_campaign.completion_pct == 60.0
+        sample_actions[3].status = ActionStatus.COMPLETED
+        assert sample_campaign.completion_pct == 80.0
+        db.flush()
+        db.refresh(sample_campaign)
+        assert sample_campaign.completion_pct == 80.0
+
     def test_campaign_completion_pct_no_actions(self, db):
         campaign = CampaignBuilder.build_campaign(
             name="Empty",
@@ -389,26 +469,118 @@ class TestModels:
         db.commit()
         assert campaign.completion_pct == 0.0
 
-    def test_action_overdue(self, db, sample_campaign):
+    def test_campaign_action_counters(self, db, sample_campaign, sample_actions):
+        db.refresh(sample_campaign)
+        assert sample_campaign.total_actions == 5
+        assert sample_campaign.completed_actions == 3
+        assert sample_campaign.verified_actions == 1
+
+        sample_actions[0].status = ActionStatus.VERIFIED
+        sample_actions[3].status = ActionStatus.COMPLETED
+        db.delete(sample_actions[4])
+        db.commit()
+        db.refresh(sample_campaign)
+        assert sample_campaign.total_actions == 4
+        assert sample_campaign.completed_actions == 4
+        assert sample_campaign.verified_actions == 2
+
+    def test_campaign_action_counters_follow_moves(self, db, sample_campaign, sample_actions):
+        other = CampaignBuilder.build_campaign(
+            name="Other",
+            campaign_type=CampaignType.CORPORATE,
+            target_summary="test",
+            goal="test",
+        )
+        db.add(other)
+        db.flush()
+
+        sample_actions[0].campaign_id = other.id
+        sample_actions[0].status = ActionStatus.VERIFIED
+        sample_actions[3].campaign_id = other.id
+        db.commit()
+        db.refresh(sample_campaign)
+        db.refresh(other)
+        assert (
+            sample_campaign.total_actions,
+            sample_campaign.completed_actions,
+            sample_campaign.verified_actions,
+        ) == (3, 2, 1)
+        assert (other.total_actions, other.completed_actions, other.verified_actions) == (2, 1, 1)
+
+    def test_campaign_action_type_totals(self, db, sample_campaign, sample_actions):
+        def totals():
+            rows = db.execute(
+                select(
+                    CampaignActionTotals.action_type,
+                    CampaignActionTotals.action_count,
+                    CampaignActionTotals.total_minutes,
+                    CampaignActionTotals.completed_count,
+                    CampaignActionTotals.completed_minutes,
+                ).where(CampaignActionTotals.campaign_id == sample_campaign.id)
+            )
+            return {row[0]: tuple(row[1:]) for row in rows if row[1]}
+
+        assert totals()[ActionType.EMAIL] == (1, 15, 1, 15)
+
+        sample_actions[0].estimated_minutes = 20
+        sample_actions[1].action_type = ActionType.EMAIL
+        sample_actions[3].status = ActionStatus.COMPLETED
+        db.delete(sample_actions[4])
+        db.commit()
+        live = totals()
+        assert live[ActionType.EMAIL] == (2, 25, 2, 25)
+
+        recount_action_type_totals(db.connection())
+        assert totals() == live
+
+    def test_deleting_campaign_drops_action_type_totals(self, db, sample_campaign, sample_actions):
+        db.delete(sample_campaign)
+        db.flush()
+        totals = db.scalars(
+            select(CampaignActionTotals).where(
+                CampaignActionTotals.campaign_id == sample_campaign.id
+            )
+        )
+        assert totals.all() == []
+
+    def test_deleting_campaign_drops_snapshots(self, db, sample_campaign, now):
+        db.add_all([
+            CampaignMetricsSnapshot(campaign_id=sample_campaign.id, metrics={}, computed_at=now),
+            CampaignROISnapshot(
+                campaign_id=sample_campaign.id,
+                roi={},
+                total_volunteer_hours=0.0,
+                roi_pct=0.0,
+                computed_at=now,
+            ),
+        ])
+        db.flush()
+        db.delete(sample_campaign)
+        db.flush()
+        for snapshot in (CampaignMetricsSnapshot, CampaignROISnapshot):
+            rows = db.scalars(select(snapshot).where(snapshot.campaign_id == sample_campaign.id))
+            assert rows.all() == []
+
+    def test_action_overdue(self, db, sample_campaign, now):
         overdue_action = Action(
             campaign_id=sample_campaign.id,
             action_type=ActionType.EMAIL,
             title="Overdue action",
             description="This should be overdue",
-            deadline=datetime.utcnow() - timedelta(days=1),
+            deadline=now - timedelta(days=1),
             status=ActionStatus.AVAILABLE,
         )
         db.add(overdue_action)
         db.commit()
         assert overdue_action.is_overdue is True
 
-    def test_action_not_overdue_when_completed(self, db, sample_campaign):
+    def test_action_not_overdue_when_completed(self, db, sample_campaign, now):
         action = Action(
             campaign_id=sample_campaign.id,
             action_type=ActionType.EMAIL,
             title="Completed on time",
             description="Done",
-            deadline=datetime.utcnow() - timedelta(days=1),
+            deadline=now - timedelta(days=1),
             status=ActionStatus.COMPLETED,
         )
         db.add(action)
@@ -431,13 +603,59 @@ class TestModels:
     def test_target_vulnerability_score(self, sample_target):
         assert sample_target.vulnerability_score == 7.5
 
+    def test_migrate_schema_upgrades_old_database(self, now):
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            campaign = CampaignBuilder.build_campaign(
+                name="Old",
+                campaign_type=CampaignType.CORPORATE,
+                target_summary="test",
+                goal="test",
+            )
+            campaign.actions.append(Action(
+                action_type=ActionType.EMAIL,
+                title="Email",
+                description="Email",
+                estimated_minutes=15,
+                status=ActionStatus.VERIFIED,
+                completed_at=now,
+            ))
+            session.add(campaign)
+            session.commit()
+        # A database from before the counters and per-type totals existed
+        with engine.begin() as connection:
+            connection.execute(text("DROP TABLE campaign_action_totals"))
+            connection.execute(text("ALTER TABLE campaigns DROP COLUMN verified_actions"))
+
+        migrate_schema(engine)
+
+        columns = {column["name"] for column in inspect(engine).get_columns("campaigns")}
+        assert "verified_actions" in columns
+        with Session(engine) as session:
+            campaign = session.scalars(select(Campaign)).one()
+            assert (campaign.total_actions, campaign.verified_actions) == (1, 1)
+            totals = session.get(CampaignActionTotals, (campaign.id, ActionType.EMAIL))
+            assert (totals.action_count, totals.completed_minutes) == (1, 15)
+        engine.dispose()
+
+    @pytest.mark.parametrize("url,expected", [
+        ("sqlite:///campaign_platform.db", "sqlite+aiosqlite"),
+        ("sqlite+pysqlite:///campaign_platform.db", "sqlite+aiosqlite"),
+        ("postgresql://user@localhost/campaigns", "postgresql+asyncpg"),
+        ("postgresql+psycopg2://user@localhost/campaigns", "postgresql+asyncpg"),
+        ("postgresql+asyncpg://user@localhost/campaigns", "postgresql+asyncpg"),
+        ("postgresql+psycopg://user@localhost/campaigns", "postgresql+psycopg"),
+    ])
+    def test_async_database_url(self, url, expected):
+        assert async_database_url(url).drivername == expected
+
 
 # --- Impact Tracker Tests ---
 
 
 class TestImpactTracker:
-    def test_compute_campaign_metrics(self, sample_campaign, sample_actions):
-        tracker = ImpactTracker()
+    def test_compute_campaign_metrics(self, tracker, sample_campaign, sample_actions):
         metrics = tracker.compute_campaign_metrics(sample_campaign, sample_actions)
 
         assert metrics["campaign_id"] == sample_campaign.id
@@ -449,20 +667,62 @@ class TestImpactTracker:
         assert metrics["activity_counts"]["social_posts"] == 1
         assert metrics["impact"]["total_impact_score"] > 0
 
-    def test_empty_campaign_metrics(self, sample_campaign):
-        tracker = ImpactTracker()
+    def test_empty_campaign_metrics(self, tracker, sample_campaign):
         metrics = tracker.compute_campaign_metrics(sample_campaign, [])
         assert metrics["summary"]["total_actions"] == 0
         assert metrics["summary"]["completion_rate"] == 0.0
 
-    def test_channel_coverage(self, sample_campaign, sample_actions):
-        tracker = ImpactTracker()
+    def test_channel_coverage(self, tracker, sample_campaign, sample_actions):
         metrics = tracker.compute_campaign_metrics(sample_campaign, sample_actions)
         assert len(metrics["channels"]["active"]) > 0
         assert metrics["channels"]["coverage_pct"] > 0
 
-    def test_media_coverage_scoring(self):
-        tracker = ImpactTracker()
+    def test_weekly_timeline_from_db(self, tracker, db, sample_campaign, sample_actions):
+        # Sunday, then the following Monday: two different weeks
+        sample_actions[0].completed_at = datetime(2025, 3, 9, 23, 30)
+        sample_actions[1].completed_at = datetime(2025, 3, 10, 0, 15)
+        sample_actions[2].completed_at = datetime(2025, 3, 12, 12, 0)
+        db.commit()
+
+        in_memory = tracker.compute_campaign_metrics(sample_campaign, sample_actions)
+        from_db = tracker.compute_campaign_metrics(sample_campaign, sample_actions, db=db)
+        assert from_db["weekly_timeline"] == in_memory["weekly_timeline"] == [
+            {"week": "2025-03-03", "actions_completed": 1},
+            {"week": "2025-03-10", "actions_completed": 2},
+        ]
+
+    def test_metrics_result_is_frozen(self, sample_campaign, sample_actions):
+        metrics = compute_campaign_metrics(sample_campaign, sample_actions)
+        assert metrics.summary.completed == 3
+        assert metrics.type_breakdown[ActionType.EMAIL].completed == 1
+        with pytest.raises(AttributeError):
+            metrics.summary.completed = 0
+        assert metrics.to_dict()["summary"]["completed"] == 3
+
+    def test_metrics_from_streamed_rows(self, tracker, db, sample_campaign, sample_actions):
+        rows = db.execute(action_metric_rows(sample_campaign.id, yield_per=2))
+        assert tracker.compute_campaign_metrics(
+            sample_campaign, rows
+        ) == tracker.compute_campaign_metrics(sample_campaign, sample_actions)
+
+    def test_compare_campaigns_in_db(self, tracker, db, sample_campaign, sample_actions):
+        other = CampaignBuilder.build_campaign(
+            name="Quiet Campaign",
+            campaign_type=CampaignType.CULTURAL,
+            target_summary="Nobody",
+            goal="Nothing yet",
+        )
+        db.add(other)
+        db.commit()
+
+        in_memory = tracker.compare_campaigns(
+            [(other, []), (sample_campaign, sample_actions)]
+        )
+        from_db = tracker.compare_campaigns_in_db(db, [other.id, sample_campaign.id])
+        assert from_db == in_memory
+        assert from_db[0]["campaign_id"] == sample_campaign.id
+
+    def test_media_coverage_scoring(self, tracker):
         mentions = [
             {"outlet": "NYT", "tier": 1, "sentiment": "positive"},
             {"outlet": "Local Paper", "tier": 3, "sentiment": "neutral"},
@@ -473,8 +733,7 @@ class TestImpactTracker:
         assert result["media_impact_score"] > 0
         assert result["by_tier"]["national"] == 1
 
-    def test_corporate_response_tracking(self):
-        tracker = ImpactTracker()
+    def test_corporate_response_tracking(self, tracker):
         responses = [
             {"date": "2026-01-01", "type": "no_response", "details": "No reply"},
             {"date": "2026-01-15", "type": "form_letter", "details": "Generic response"},
@@ -489,8 +748,7 @@ class TestImpactTracker:
 
 
 class TestROICalculator:
-    def test_calculate_campaign_roi(self, sample_campaign, sample_actions):
-        calculator = ROICalculator()
+    def test_calculate_campaign_roi(self, calculator, sample_campaign, sample_actions):
         roi = calculator.calculate_campaign_roi(sample_campaign, sample_actions)
 
         assert roi["campaign_id"] == sample_campaign.id
@@ -500,13 +758,11 @@ class TestROICalculator:
         assert "value_per_volunteer_hour" in roi["efficiency"]
         assert len(roi["recommendations"]) > 0
 
-    def test_empty_campaign_roi(self, sample_campaign):
-        calculator = ROICalculator()
+    def test_empty_campaign_roi(self, calculator, sample_campaign):
         roi = calculator.calculate_campaign_roi(sample_campaign, [])
         assert roi["investment"]["total_volunteer_hours"] == 0.0
 
-    def test_project_impact(self, sample_campaign, sample_actions):
-        calculator = ROICalculator()
+    def test_project_impact(self, calculator, sample_campaign, sample_actions):
         projection = calculator.project_impact(
             campaign=sample_campaign,
             actions=sample_actions,
@@ -516,8 +772,26 @@ class TestROICalculator:
         assert projection["projected_additional_actions"] > 0
         assert projection["projected_additional_value"] > 0
 
-    def test_project_impact_focused(self, sample_campaign, sample_actions):
-        calculator = ROICalculator()
+    def test_project_impact_distributed_values(self, calculator, sample_campaign):
+        # 8 hours split evenly: 2h each of phone, comment, FOIA and email. The
+        # distributed projection values FOIA at the $5 email rate.
+        completed = [
+            Action(action_type=action_type, status=ActionStatus.COMPLETED)
+            for action_type in (
+                ActionType.PHONE_CALL,
+                ActionType.PUBLIC_COMMENT,
+                ActionType.FOIA_REQUEST,
+                ActionType.EMAIL,
+            )
+        ]
+        projection = calculator.project_impact(
+            campaign=sample_campaign, actions=completed, additional_hours=8.0
+        )
+        assert projection["projected_additional_actions"] == 20 + 4 + 1 + 8
+        assert projection["projected_additional_value"] == 20 * 15.0 + 4 * 50.0 + 5.0 + 8 * 5.0
+        assert projection["projected_new_total_actions"] == 4 + 33
+
+    def test_project_impact_focused(self, calculator, sample_campaign, sample_actions):
         projection = calculator.project_impact(
             campaign=sample_campaign,
             actions=sample_actions,
@@ -527,66 +801,178 @@ class TestROICalculator:
         assert projection["focus_type"] == "phone_call"
         assert projection["projected_additional_actions"] > 0
 
+    def test_roi_reduction_backends_agree(self):
+        rng = np.random.default_rng(7)
+        n = 5000
+        args = (
+            rng.integers(0, len(ActionType), n).astype(np.int32),
+            rng.integers(0, len(ActionStatus), n).astype(np.int8),
+            rng.integers(1, 240, n).astype(np.float64),
+            rng.random(n) < 0.2,
+            roi_calculator._N_TYPES,
+            roi_calculator._COMPLETED_STATUS_ID,
+            roi_calculator._VERIFIED_STATUS_ID,
+            roi_calculator._EXPIRED_STATUS_ID,
+        )
+        for got, expected in zip(
+            roi_calculator._reduce(*args), roi_calculator._reduce_numpy(*args)
+        ):
+            np.testing.assert_array_equal(got, expected)
+
+    def test_roi_context_matches_direct_calls(self, calculator, sample_campaign, sample_actions):
+        context = calculator.analyze(sample_campaign, sample_actions)
+        assert calculator.roi_from_context(context) == calculator.calculate_campaign_roi(
+            sample_campaign, sample_actions
+        )
+        for focus_type in (None, ActionType.PHONE_CALL):
+            assert calculator.project_from_context(
+                context, 10.0, focus_type=focus_type
+            ) == calculator.project_impact(
+                sample_campaign, sample_actions, 10.0, focus_type=focus_type
+            )
+
+    def test_roi_from_query_matches_objects(
+        self, calculator, db, sample_campaign, sample_actions, now
+    ):
+        sample_actions[-1].deadline = now - timedelta(days=1)
+        db.commit()
+        from_objects = calculator.calculate_campaign_roi(sample_campaign, sample_actions)
+        assert calculator.from_query(db, sample_campaign) == from_objects
+
+    def test_roi_from_dataframe_matches_objects(
+        self, calculator, db, sample_campaign, sample_actions, now
+    ):
+        sample_actions[-1].deadline = now - timedelta(days=1)
+        sample_actions[-2].status = ActionStatus.EXPIRED
+        db.commit()
+        df = pd.DataFrame(
+            db.execute(roi_calculator.action_roi_rows(sample_campaign.id)).all(),
+            columns=["action_type", "status", "estimated_minutes", "is_overdue"],
+            dtype=object,
+        )
+        assert calculator.calculate_campaign_roi_df(
+            sample_campaign, df
+        ) == calculator.calculate_campaign_roi(sample_campaign, sample_actions)
+
+    def test_roi_from_totals_matches_query(
+        self, calculator, db, sample_campaign, sample_actions, now
+    ):
+        sample_actions[-1].deadline = now - timedelta(days=1)
+        sample_actions[-2].status = ActionStatus.EXPIRED
+        sample_actions[0].status = ActionStatus.VERIFIED
+        db.commit()
+        assert calculator.from_totals(db, sample_campaign) == calculator.from_query(
+            db, sample_campaign
+        )
+
+    def test_roi_snapshot(self, calculator, db, sample_campaign, sample_actions):
+        roi = calculator.refresh_snapshot(db, sample_campaign)
+        db.commit()
+
+        snapshot = db.get(CampaignROISnapshot, sample_campaign.id)
+        assert snapshot.roi["returns"] == roi["returns"]
+        assert snapshot.total_volunteer_hours == roi["investment"]["total_volunteer_hours"]
+        assert snapshot.roi_pct == roi["efficiency"]["roi_pct"]
+
+        # Refreshing again updates the existing row
+        sample_actions[-1].status = ActionStatus.COMPLETED
+        db.commit()
+        calculator.refresh_snapshot(db, sample_campaign)
+        db.commit()
+        assert db.get(CampaignROISnapshot, sample_campaign.id).roi["investment"][
+            "total_actions_completed"
+        ] == roi["investment"]["total_actions_completed"] + 1
+
+    def test_roi_recomputed_after_action_change(self, calculator, sample_campaign, sample_actions):
+        first = calculator.calculate_campaign_roi(sample_campaign, sample_actions)
+        again = calculator.calculate_campaign_roi(sample_campaign, sample_actions)
+        assert again == first
+        again["recommendations"].clear()
+        assert calculator.calculate_campaign_roi(sample_campaign, sample_actions) == first
+
+        pending = next(a for a in sample_actions if a.status == ActionStatus.AVAILABLE)
+        pending.status = ActionStatus.COMPLETED
+        updated = calculator.calculate_campaign_roi(sample_campaign, sample_actions)
+        assert (
+            updated["investment"]["total_actions_completed"]
+            == first["investment"]["total_actions_completed"] + 1
+        )
+
+    def test_roi_with_unhashable_outcome_fields(self, calculator, sample_campaign, sample_actions):
+        outcomes = [{"type": "corporate_response", "sources": ["a", "b"]}]
+        roi = calculator.calculate_campaign_roi(sample_campaign, sample_actions, outcomes)
+        returns = roi["returns"]
+        assert returns["outcome_value"] == 5000.0
+        assert returns["total_value"] == returns["action_value"] + 5000.0
+        assert calculator.calculate_campaign_roi(sample_campaign, sample_actions, outcomes) == roi
+
 
 # --- Scheduler Tests ---
 
 
 class TestActionScheduler:
+    # The scheduler only reads the ids, so every test can share these
+    IDS10 = tuple(range(1, 11))
+    IDS20 = tuple(range(1, 21))
+    IDS30 = tuple(range(1, 31))
+    # Monday to Friday, and Monday to the following Friday
+    WEEK_WINDOW = ScheduleWindow(
+        start=datetime(2026, 3, 2, 9, 0),
+        end=datetime(2026, 3, 6, 17, 0),
+    )
+    FORTNIGHT_WINDOW = ScheduleWindow(
+        start=datetime(2026, 3, 2, 9, 0),
+        end=datetime(2026, 3, 13, 17, 0),
+    )
+
     def test_schedule_email_campaign(self):
         scheduler = ActionScheduler()
-        window = ScheduleWindow(
-            start=datetime(2026, 3, 2, 9, 0),  # Monday
-            end=datetime(2026, 3, 13, 17, 0),   # Friday
-        )
         scheduled = scheduler.schedule_email_campaign(
-            action_ids=list(range(1, 21)),
-            window=window,
+            action_ids=self.IDS20,
+            window=self.FORTNIGHT_WINDOW,
             emails_per_day=5,
         )
         assert len(scheduled) > 0
         # All scheduled during business hours
-        for sa in scheduled:
-            assert 6 <= sa.scheduled_start.hour <= 18
-            assert sa.scheduled_start.weekday() < 5  # weekday
+        hours = np.array([sa.scheduled_start.hour for sa in scheduled], dtype=np.int8)
+        weekdays = np.array([sa.scheduled_start.weekday() for sa in scheduled], dtype=np.int8)
+        assert ((hours >= 6) & (hours <= 18)).all()
+        assert (weekdays < 5).all()  # weekday
 
     def test_schedule_social_burst(self):
         scheduler = ActionScheduler()
         burst_time = datetime(2026, 3, 5, 19, 0)  # Thursday 7pm
         scheduled = scheduler.schedule_social_burst(
-            action_ids=list(range(1, 11)),
+            action_ids=self.IDS10,
             burst_time=burst_time,
         )
         assert len(scheduled) == 10
         # All within burst window
-        for sa in scheduled:
-            delta = abs((sa.scheduled_start - burst_time).total_seconds())
-            assert delta < 900  # within 15 minutes
+        starts = np.array([sa.scheduled_start for sa in scheduled], dtype="datetime64[s]")
+        offsets = np.abs(starts - np.datetime64(burst_time, "s"))
+        assert offsets.max() < np.timedelta64(900, "s")  # within 15 minutes
 
     def test_schedule_phone_bank(self):
         scheduler = ActionScheduler()
-        window = ScheduleWindow(
-            start=datetime(2026, 3, 2, 9, 0),
-            end=datetime(2026, 3, 6, 17, 0),
-        )
         scheduled = scheduler.schedule_phone_bank(
-            action_ids=list(range(1, 11)),
-            window=window,
+            action_ids=self.IDS10,
+            window=self.WEEK_WINDOW,
         )
         assert len(scheduled) > 0
-        for sa in scheduled:
-            assert 9 <= sa.scheduled_start.hour < 17
+        hours = np.array([sa.scheduled_start.hour for sa in scheduled], dtype=np.int8)
+        assert ((hours >= 9) & (hours < 17)).all()
 
     def test_schedule_comment_period(self):
         scheduler = ActionScheduler()
         deadline = datetime(2026, 4, 15, 23, 59)
         scheduled = scheduler.schedule_comment_period(
-            action_ids=list(range(1, 31)),
+            action_ids=self.IDS30,
             comment_deadline=deadline,
         )
         assert len(scheduled) == 30
         # All before deadline
-        for sa in scheduled:
-            assert sa.scheduled_start < deadline
+        starts = np.array([sa.scheduled_start for sa in scheduled], dtype="datetime64[s]")
+        assert (starts < np.datetime64(deadline, "s")).all()
         # Should have early, middle, and ramp-up batches
         batch_ids = set(sa.batch_id for sa in scheduled)
         assert "comment-early" in batch_ids
@@ -599,8 +985,8 @@ class TestActionScheduler:
             {"phase": 2, "name": "Public Pressure", "duration_weeks": 4, "tactics": []},
         ]
         actions_per_phase = {
-            1: list(range(1, 6)),
-            2: list(range(6, 16)),
+            1: tuple(range(1, 6)),
+            2: tuple(range(6, 16)),
         }
         scheduled = scheduler.schedule_escalation_sequence(
             phases=phases,
@@ -616,13 +1002,9 @@ class TestActionScheduler:
 
     def test_schedule_summary(self):
         scheduler = ActionScheduler()
-        window = ScheduleWindow(
-            start=datetime(2026, 3, 2, 9, 0),
-            end=datetime(2026, 3, 6, 17, 0),
-        )
         scheduled = scheduler.schedule_email_campaign(
-            action_ids=list(range(1, 11)),
-            window=window,
+            action_ids=self.IDS10,
+            window=self.WEEK_WINDOW,
         )
         summary = scheduler.get_schedule_summary(scheduled)
         assert summary["total"] > 0